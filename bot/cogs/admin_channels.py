@@ -2,7 +2,12 @@ import discord
 from discord.ext import commands
 import logging
 
+from bot.utils.db_throttle import run_db
+
 logger = logging.getLogger(__name__)
+_log_exc = logger.exception
+
+_VALID_CHANNEL_TYPES = frozenset(("killfeed", "leaderboard", "stats"))
 
 class AdminChannels(commands.Cog):
     """Admin channel management"""
@@ -13,24 +18,28 @@ class AdminChannels(commands.Cog):
     @discord.slash_command(name="configure", description="Configure bot channels")
     @commands.has_permissions(administrator=True)
     async def configure(self, ctx: discord.ApplicationContext,
-                       channel_type: discord.Option(str, "Channel type", choices=["killfeed", "leaderboard", "stats"]),
+                       channel_type: discord.Option(str, "Channel type", choices=sorted(_VALID_CHANNEL_TYPES)),
                        channel: discord.Option(discord.TextChannel, "Channel to configure")):
         """Configure bot channels"""
+        if channel_type not in _VALID_CHANNEL_TYPES:
+            await ctx.respond("❌ Invalid channel type", ephemeral=True)
+            return
+
+        if not self.bot.db_ready.is_set():
+            await ctx.respond("❌ Database unavailable", ephemeral=True)
+            return
+
         try:
             await ctx.defer(ephemeral=True)
 
-            if not self.bot.db_manager:
-                await ctx.followup.send("❌ Database unavailable", ephemeral=True)
-                return
-
             guild_id = ctx.guild_id
 
             # Update channel configuration
-            await self.bot.db_manager.update_channel_config(guild_id, channel_type, channel.id)
+            await run_db(self.bot, self.bot.db_manager.update_channel_config, guild_id, channel_type, channel.id)
             await ctx.followup.send(f"✅ {channel_type} channel set to {channel.mention}", ephemeral=True)
 
-        except Exception as e:
-            logger.error(f"Configure command error: {e}")
+        except Exception:
+            _log_exc("Configure command error")
             await ctx.followup.send("❌ Failed to configure channel", ephemeral=True)
 
 async def setup(bot):
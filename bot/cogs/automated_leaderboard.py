@@ -5,10 +5,11 @@ Posts and updates consolidated leaderboards every 30 minutes
 
 import asyncio
 import logging
+import re
 
 import discord
 from discord.commands import SlashCommandGroup
-from discord.ext import commands
+from discord.ext import commands, tasks
 from bot.cogs.autocomplete import ServerAutocomplete
 from bot.utils.embed_factory import EmbedFactory
 
@@ -18,15 +19,40 @@ from bot.utils.embed_factory import EmbedFactory
 
 logger = logging.getLogger(__name__)
 
+# Relative "Last Updated" timestamps change every run even when the standings don't
+_RELATIVE_TIMESTAMP_RE = re.compile(r"<t:\d+:R>")
+
+def _leaderboard_content(embed: discord.Embed) -> tuple:
+    """Comparable view of a leaderboard embed, ignoring per-run timestamps"""
+    return (
+        embed.title,
+        embed.description,
+        tuple((field.name, _RELATIVE_TIMESTAMP_RE.sub("", field.value or "")) for field in embed.fields)
+    )
+
+def _has_persistent_view(message: discord.Message) -> bool:
+    """Whether the message's components carry LeaderboardView's fixed custom_ids"""
+    return any(
+        getattr(child, "custom_id", None) == "leaderboard:refresh"
+        for row in message.components
+        for child in getattr(row, "children", ())
+    )
+
 class LeaderboardView(discord.ui.View):
-    """Interactive view for enhanced leaderboard with multi-user functionality"""
+    """
+    Interactive view for enhanced leaderboard with multi-user functionality
+
+    Every component has a fixed custom_id and the guild comes from the
+    interaction, so one instance registered with bot.add_view keeps the
+    buttons on already-posted leaderboards working across restarts.
+    """
 
-    def __init__(self, guild_id: int):
+    def __init__(self):
         super().__init__(timeout=None)  # Persistent view
-        self.guild_id = guild_id
 
-    @discord.ui.button(label="📊 Detailed Stats", style=discord.ButtonStyle.primary, emoji="📊")
-    async def detailed_stats(self, interaction: discord.Interaction, button: discord.ui.Button):
+    @discord.ui.button(label="📊 Detailed Stats", style=discord.ButtonStyle.primary, emoji="📊",
+                       custom_id="leaderboard:detailed_stats")
+    async def detailed_stats(self, button: discord.ui.Button, interaction: discord.Interaction):
         """Show detailed player statistics"""
         await interaction.response.defer(ephemeral=True)
 
@@ -50,8 +76,9 @@ class LeaderboardView(discord.ui.View):
         embed.set_footer(text="Use slash commands for detailed statistics")
         await interaction.followup.send(embed=embed, ephemeral=True)
 
-    @discord.ui.button(label="🔄 Refresh", style=discord.ButtonStyle.secondary, emoji="🔄")
-    async def refresh_leaderboard(self, interaction: discord.Interaction, button: discord.ui.Button):
+    @discord.ui.button(label="🔄 Refresh", style=discord.ButtonStyle.secondary, emoji="🔄",
+                       custom_id="leaderboard:refresh")
+    async def refresh_leaderboard(self, button: discord.ui.Button, interaction: discord.Interaction):
         """Manually refresh the leaderboard"""
         await interaction.response.defer()
 
@@ -60,7 +87,7 @@ class LeaderboardView(discord.ui.View):
         if cog:
             # Find guild config
             guild_config = await interaction.client.db_manager.guild_configs.find_one({
-                "guild_id": self.guild_id
+                "guild_id": interaction.guild_id
             })
 
             if guild_config:
@@ -73,6 +100,7 @@ class LeaderboardView(discord.ui.View):
             await interaction.followup.send("❌ Leaderboard system unavailable", ephemeral=True)
 
     @discord.ui.select(
+        custom_id="leaderboard:category",
         placeholder="🎮 Select Category...",
         options=[
             discord.SelectOption(label="Top Killers", value="kills", emoji="🔥"),
@@ -83,7 +111,7 @@ class LeaderboardView(discord.ui.View):
             discord.SelectOption(label="Factions", value="factions", emoji="🏛️")
         ]
     )
-    async def category_select(self, interaction: discord.Interaction, select: discord.ui.Select):
+    async def category_select(self, select: discord.ui.Select, interaction: discord.Interaction):
         """Show specific leaderboard category"""
         await interaction.response.defer(ephemeral=True)
 
@@ -107,23 +135,21 @@ class LeaderboardView(discord.ui.View):
         try:
             # Get data based on category
             if category == "kills":
-                data = await cog.get_top_kills(self.guild_id, 10)
+                data = await cog.get_top_kills(interaction.guild_id, 10)
                 if data:
-                    text = ""
-                    for i, player in enumerate(data, 1):
-                        name = player.get('player_name', 'Unknown')
-                        kills = player.get('kills', 0)
-                        text += f"`{i:2}.` **{name}** • `{kills:,}` kills\n"
+                    text = "\n".join(
+                        f"`{i:2}.` **{player.get('player_name', 'Unknown')}** • `{player.get('kills', 0):,}` kills"
+                        for i, player in enumerate(data, 1)
+                    )
                     embed.add_field(name="🔥 Top Eliminators", value=text or "No data", inline=False)
 
             elif category == "kdr":
-                data = await cog.get_top_kdr(self.guild_id, 10)
+                data = await cog.get_top_kdr(interaction.guild_id, 10)
                 if data:
-                    text = ""
-                    for i, player in enumerate(data, 1):
-                        name = player.get('player_name', 'Unknown')
-                        kdr = player.get('kdr', 0.0)
-                        text += f"`{i:2}.` **{name}** • `{kdr:.2f}` KDR\n"
+                    text = "\n".join(
+                        f"`{i:2}.` **{player.get('player_name', 'Unknown')}** • `{player.get('kdr', 0.0):.2f}` KDR"
+                        for i, player in enumerate(data, 1)
+                    )
                     embed.add_field(name="⚡ Elite Ratios", value=text or "No data", inline=False)
 
             # Add more categories as needed
@@ -141,11 +167,18 @@ class AutomatedLeaderboard(discord.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        self.message_cache = {}  # Store {guild_id: message_id}
+        self.message_cache = {}  # Store {channel_id: (message_id, leaderboard content)} for the last post we know of
+        self._tasks: Dict[str, asyncio.Task] = {}  # Background tasks owned by this cog, by name
+        # At most this many guild leaderboards rebuild at once (DB queries + Discord edits)
+        self._leaderboard_sem = asyncio.Semaphore(8)
+        # Overlapping rebuilds of the same (guild_id, server_id) share one set of queries
+        self._inflight_data: Dict[tuple, asyncio.Future] = {}
+        # Route button presses on leaderboards posted before a restart back to this view
+        self.bot.add_view(LeaderboardView())
         logger.info("🤖 Automated leaderboard cog initialized")
 
         # Start tasks after bot is ready
-        self.bot.loop.create_task(self.start_after_ready())
+        self._tasks["start_after_ready"] = self.bot.loop.create_task(self.start_after_ready())
 
     async def start_after_ready(self):
         """Start automated leaderboard after bot is ready"""
@@ -159,6 +192,9 @@ class AutomatedLeaderboard(discord.Cog):
     def cog_unload(self):
         """Stop the task when cog unloads"""
         self.automated_leaderboard_task.cancel()
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
 
     @tasks.loop(minutes=60)
     async def automated_leaderboard_task(self):
@@ -174,18 +210,26 @@ class AutomatedLeaderboard(discord.Cog):
 
             guilds_with_leaderboard = await guilds_cursor.to_list(length=None)
 
-            for guild_config in guilds_with_leaderboard:
-                try:
-                    await self.update_guild_leaderboard(guild_config)
-                except Exception as e:
-                    guild_id = guild_config.get('guild_id', 'Unknown')
-                    logger.error(f"Failed to update leaderboard for guild {guild_id}: {e}")
+            # Guilds are independent, so update them concurrently instead of one after another
+            await asyncio.gather(*(
+                self._update_guild_leaderboard_logged(guild_config)
+                for guild_config in guilds_with_leaderboard
+            ))
 
             logger.info(f"Automated leaderboard update completed for {len(guilds_with_leaderboard)} guilds")
 
         except Exception as e:
             logger.error(f"Error in automated leaderboard task: {e}")
 
+    async def _update_guild_leaderboard_logged(self, guild_config: Dict[str, Any]):
+        """Update one guild's leaderboard, logging rather than raising so one guild can't fail the batch"""
+        try:
+            async with self._leaderboard_sem:
+                await self.update_guild_leaderboard(guild_config)
+        except Exception as e:
+            guild_id = guild_config.get('guild_id', 'Unknown')
+            logger.error(f"Failed to update leaderboard for guild {guild_id}: {e}")
+
     @automated_leaderboard_task.before_loop
     async def before_automated_leaderboard(self):
         """Wait for bot to be ready before starting task"""
@@ -205,22 +249,29 @@ class AutomatedLeaderboard(discord.Cog):
 
             guilds_with_leaderboard = await guilds_cursor.to_list(length=None)
 
-            for guild_config in guilds_with_leaderboard:
-                try:
-                    # Only create if missing
-                    missing = await self.check_missing_leaderboards(guild_config)
-                    if missing:
-                        await self.update_guild_leaderboard(guild_config, force_create=True)
-                        logger.info(f"Created missing leaderboard for guild {guild_config.get('guild_id')}")
-                    else:
-                        logger.info(f"Leaderboard already exists for guild {guild_config.get('guild_id')}")
-                except Exception as e:
-                    guild_id = guild_config.get('guild_id', 'Unknown')
-                    logger.error(f"Failed to check/create leaderboard for guild {guild_id}: {e}")
+            await asyncio.gather(*(
+                self._create_leaderboard_if_missing(guild_config)
+                for guild_config in guilds_with_leaderboard
+            ))
 
         except Exception as e:
             logger.error(f"Error in initial leaderboard check: {e}")
 
+    async def _create_leaderboard_if_missing(self, guild_config: Dict[str, Any]):
+        """Post a leaderboard for one guild only if its channel doesn't already have one"""
+        try:
+            async with self._leaderboard_sem:
+                missing = await self.check_missing_leaderboards(guild_config)
+                if missing:
+                    await self.update_guild_leaderboard(guild_config, force_create=True)
+            if missing:
+                logger.info(f"Created missing leaderboard for guild {guild_config.get('guild_id')}")
+            else:
+                logger.info(f"Leaderboard already exists for guild {guild_config.get('guild_id')}")
+        except Exception as e:
+            guild_id = guild_config.get('guild_id', 'Unknown')
+            logger.error(f"Failed to check/create leaderboard for guild {guild_id}: {e}")
+
     async def check_missing_leaderboards(self, guild_config: Dict[str, Any]) -> bool:
         """Check if leaderboard messages are missing in the channel"""
         try:
@@ -295,6 +346,22 @@ class AutomatedLeaderboard(discord.Cog):
 
 
     async def _collect_leaderboard_data(self, guild_id: int, server_id: str = None) -> Dict[str, Any]:
+        """Collect all leaderboard data, joining an identical collection already in flight"""
+        key = (guild_id, server_id)
+        future = self._inflight_data.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(self._load_leaderboard_data(guild_id, server_id))
+        self._inflight_data[key] = future
+        try:
+            # Shielded so this caller's cancellation doesn't cancel the load for joined callers
+            return await asyncio.shield(future)
+        finally:
+            if self._inflight_data.get(key) is future:
+                del self._inflight_data[key]
+
+    async def _load_leaderboard_data(self, guild_id: int, server_id: str = None) -> Dict[str, Any]:
         """Collect all leaderboard data from correct database collections"""
         try:
             data = {}
@@ -306,7 +373,6 @@ class AutomatedLeaderboard(discord.Cog):
 
             # Top killers from pvp_data
             kills_cursor = self.bot.db_manager.pvp_data.find(base_query).sort("kills", -1).limit(10)
-            data["top_killers"] = await kills_cursor.to_list(length=None)
 
             # Top KDR (only players with deaths > 0)
             kdr_query = {**base_query, "deaths": {"$gt": 0}}
@@ -317,15 +383,12 @@ class AutomatedLeaderboard(discord.Cog):
                 {"$limit": 10}
             ]
             kdr_cursor = self.bot.db_manager.pvp_data.aggregate(kdr_pipeline)
-            data["top_kdr"] = await kdr_cursor.to_list(length=None)
 
             # Longest distances from pvp_data
             distance_cursor = self.bot.db_manager.pvp_data.find(base_query).sort("personal_best_distance", -1).limit(10)
-            data["top_distances"] = await distance_cursor.to_list(length=None)
 
             # Best streaks from pvp_data
             streak_cursor = self.bot.db_manager.pvp_data.find(base_query).sort("longest_streak", -1).limit(10)
-            data["top_streaks"] = await streak_cursor.to_list(length=None)
 
             # Top weapons from kill_events
             weapon_pipeline = [
@@ -335,11 +398,20 @@ class AutomatedLeaderboard(discord.Cog):
                 {"$limit": 10}
             ]
             weapon_cursor = self.bot.db_manager.kill_events.aggregate(weapon_pipeline)
-            data["top_weapons"] = await weapon_cursor.to_list(length=None)
 
             # Top factions from factions collection
             faction_cursor = self.bot.db_manager.factions.find(base_query).sort("kills", -1).limit(5)
-            data["top_factions"] = await faction_cursor.to_list(length=None)
+
+            # The sections are independent; fetch them in one wake-up instead of six serial round trips
+            (data["top_killers"], data["top_kdr"], data["top_distances"],
+             data["top_streaks"], data["top_weapons"], data["top_factions"]) = await asyncio.gather(
+                kills_cursor.to_list(length=None),
+                kdr_cursor.to_list(length=None),
+                distance_cursor.to_list(length=None),
+                streak_cursor.to_list(length=None),
+                weapon_cursor.to_list(length=None),
+                faction_cursor.to_list(length=None)
+            )
 
             return data
 
@@ -387,17 +459,36 @@ class AutomatedLeaderboard(discord.Cog):
 
                 if embed:
                     # Create interactive components for multi-user functionality
-                    view = LeaderboardView(guild_id)
+                    view = LeaderboardView()
+
+                    content = _leaderboard_content(embed)
+                    cached = None if force_create else self.message_cache.get(channel.id)
+
+                    # A message we posted or edited this session can be compared and edited without fetching it
+                    if cached and cached[1] == content:
+                        logger.debug(f"Leaderboard unchanged for guild {guild_id}, skipping edit")
+                        return
+                    if cached and await self._edit_cached_leaderboard(channel, cached[0], embed, view):
+                        self.message_cache[channel.id] = (cached[0], content)
+                        logger.info("Updated cached enhanced leaderboard with interactive components")
+                        return
 
                     # Try to find and update existing leaderboard message
                     existing_message = None
                     if not force_create:
                         existing_message = await self.find_existing_leaderboard_message(channel, "Consolidated Leaderboard")
 
-                    if existing_message:
+                    if existing_message and existing_message.embeds and \
+                            _leaderboard_content(existing_message.embeds[0]) == content and \
+                            _has_persistent_view(existing_message):
+                        # Standings unchanged since the last post; skip the Discord edit
+                        self.message_cache[channel.id] = (existing_message.id, content)
+                        logger.debug(f"Leaderboard unchanged for guild {guild_id}, skipping edit")
+                    elif existing_message:
                         # Edit existing message with new embed and components
                         try:
                             await existing_message.edit(embed=embed, view=view)
+                            self.message_cache[channel.id] = (existing_message.id, content)
                             logger.info(f"Updated existing enhanced leaderboard with interactive components")
                         except Exception as edit_error:
                             logger.warning(f"Failed to edit existing message, posting new one: {edit_error}")
@@ -415,6 +506,17 @@ class AutomatedLeaderboard(discord.Cog):
         except Exception as e:
             logger.error(f"Failed to update guild leaderboard: {e}")
 
+    async def _edit_cached_leaderboard(self, channel, message_id: int, embed, view) -> bool:
+        """Edit a known leaderboard message by ID without fetching it first; False if that failed"""
+        try:
+            await channel.get_partial_message(message_id).edit(embed=embed, view=view)
+            return True
+        except discord.NotFound:
+            self.message_cache.pop(channel.id, None)
+        except discord.HTTPException as e:
+            logger.warning(f"Failed to edit cached leaderboard message {message_id}: {e}")
+        return False
+
     async def get_stored_leaderboard_message_id(self, guild_id: int, channel_id: int) -> Optional[int]:
         """Get stored leaderboard message ID from database for persistence across restarts"""
         try:
@@ -544,20 +646,8 @@ class AutomatedLeaderboard(discord.Cog):
         """Check if guild has premium access"""
         # Automated leaderboards is guild-wide premium feature - requires at least 1 premium server
         try:
-            if hasattr(self.bot, 'premium_manager_v2'):
-                return await self.bot.premium_manager_v2.has_premium_access(guild_id)
-            else:
-                # Fallback to old method
-                guild_doc = await self.bot.db_manager.get_guild(guild_id)
-                if not guild_doc:
-                    return False
-
-                servers = guild_doc.get('servers', [])
-                for server_config in servers:
-                    server_id = server_config.get('server_id', server_config.get('_id', 'default'))
-                    if await self.check_premium_access(guild_id):
-                        return True
-                return False
+            check = self.bot.premium_access_check
+            return await check(guild_id) if check else False
         except Exception as e:
             logger.error(f"Failed to check premium access for leaderboards: {e}")
             return False
@@ -579,6 +669,12 @@ class AutomatedLeaderboard(discord.Cog):
             # Set thumbnail logo
             embed.set_thumbnail(url="attachment://Leaderboard.png")
 
+            # Faction tags for every name shown below come back in one query
+            factions = await self.get_player_factions(guild_id, [
+                player.get('player_name')
+                for player in data.get('top_killers', [])[:5] + data.get('top_kdr', [])[:3] + data.get('top_distances', [])[:3]
+            ])
+
             # Set author with server branding
             embed.set_author(
                 name="Emerald's Killfeed",
@@ -587,7 +683,7 @@ class AutomatedLeaderboard(discord.Cog):
 
             # Top Killers Section (Enhanced with emojis and formatting)
             if data.get('top_killers'):
-                killer_text = ""
+                killer_lines = []
                 medals = ["🥇", "🥈", "🥉", "🏅", "🎖️"]
 
                 for i, player in enumerate(data['top_killers'][:5], 1):
@@ -595,8 +691,7 @@ class AutomatedLeaderboard(discord.Cog):
                     kills = player.get('kills', 0)
                     deaths = player.get('deaths', 0)
 
-                    # Get faction info
-                    faction = await self.get_player_faction(guild_id, name)
+                    faction = factions.get(name)
                     faction_badge = f" `[{faction}]`" if faction else ""
 
                     # Medal or rank indicator
@@ -605,51 +700,48 @@ class AutomatedLeaderboard(discord.Cog):
                     # Calculate KDR for display
                     kdr = round(kills / max(deaths, 1), 2)
 
-                    killer_text += f"{rank_indicator} **{name}**{faction_badge}\n"
-                    killer_text += f"   └ `{kills:,}` kills • `{kdr}` KDR\n\n"
+                    killer_lines.append(f"{rank_indicator} **{name}**{faction_badge}\n   └ `{kills:,}` kills • `{kdr}` KDR")
 
                 embed.add_field(
                     name="🔥 **TOP ELIMINATORS**",
-                    value=killer_text or "No data available",
+                    value="\n\n".join(killer_lines) or "No data available",
                     inline=True
                 )
 
             # Top KDR Section (Enhanced)
             if data.get('top_kdr'):
-                kdr_text = ""
+                kdr_lines = []
                 for i, player in enumerate(data['top_kdr'][:3], 1):
                     name = player.get('player_name', 'Unknown')
                     kdr = player.get('kdr', 0.0)
                     kills = player.get('kills', 0)
 
-                    faction = await self.get_player_faction(guild_id, name)
+                    faction = factions.get(name)
                     faction_badge = f" `[{faction}]`" if faction else ""
 
-                    kdr_text += f"`{i}.` **{name}**{faction_badge}\n"
-                    kdr_text += f"   └ `{kdr:.2f}` KDR • `{kills}` kills\n\n"
+                    kdr_lines.append(f"`{i}.` **{name}**{faction_badge}\n   └ `{kdr:.2f}` KDR • `{kills}` kills")
 
                 embed.add_field(
                     name="⚡ **ELITE RATIOS**",
-                    value=kdr_text or "No data available",
+                    value="\n\n".join(kdr_lines) or "No data available",
                     inline=True
                 )
 
             # Top Distances Section (Enhanced)
             if data.get('top_distances'):
-                distance_text = ""
+                distance_lines = []
                 for i, player in enumerate(data['top_distances'][:3], 1):
                     name = player.get('player_name', 'Unknown')
                     distance = player.get('personal_best_distance', 0.0)
 
-                    faction = await self.get_player_faction(guild_id, name)
+                    faction = factions.get(name)
                     faction_badge = f" `[{faction}]`" if faction else ""
 
-                    distance_text += f"`{i}.` **{name}**{faction_badge}\n"
-                    distance_text += f"   └ `{distance:,.0f}m` longest shot\n\n"
+                    distance_lines.append(f"`{i}.` **{name}**{faction_badge}\n   └ `{distance:,.0f}m` longest shot")
 
                 embed.add_field(
                     name="🎯 **SNIPER ELITE**",
-                    value=distance_text or "No data available",
+                    value="\n\n".join(distance_lines) or "No data available",
                     inline=True
                 )
 
@@ -755,4 +847,35 @@ class AutomatedLeaderboard(discord.Cog):
 
     async def get_top_weapons(self, guild_id: int, limit: int, server_id: str = None) -> List[Dict[str, Any]]:
         """Get top weapons by kill count - using same method as working /leaderboard weapons"""
-        try:
\ No newline at end of file
+        try:
+            query = {
+                "guild_id": guild_id,
+                "is_suicide": False,
+                "weapon": {"$nin": ["Menu Suicide", "Suicide", "Falling", "suicide_by_relocation"]}
+            }
+
+            # Add server filter if specified
+            if server_id:
+                query["server_id"] = server_id
+
+            cursor = self.bot.db_manager.kill_events.aggregate([
+                {"$match": query},
+                {"$group": {"_id": "$weapon", "kills": {"$sum": 1}, "top_user": {"$first": "$killer"}}},
+                {"$sort": {"kills": -1}},
+                {"$limit": limit}
+            ])
+            return await cursor.to_list(length=None)
+        except Exception as e:
+            logger.error(f"Failed to get top weapons: {e}")
+            return []
+
+    async def get_player_factions(self, guild_id: int, player_names: List[str]) -> Dict[str, str]:
+        """Faction tags for every named player in one query; an empty map if the lookup fails"""
+        try:
+            return await self.bot.db_manager.get_player_factions(guild_id, player_names)
+        except Exception as e:
+            logger.error(f"Failed to get player factions: {e}")
+            return {}
+
+def setup(bot):
+    bot.add_cog(AutomatedLeaderboard(bot))
@@ -31,12 +31,8 @@ class Bounties(discord.Cog):
     async def check_premium_access(self, guild_id: int) -> bool:
         """Check if guild has premium access - unified validation"""
         try:
-
-            pass
-            if hasattr(self.bot, 'premium_manager_v2'):
-                return await self.bot.premium_manager_v2.has_premium_access(guild_id)
-            else:
-                return False
+            check = self.bot.premium_access_check
+            return await check(guild_id) if check else False
         except Exception as e:
             logger.error(f"Premium access check failed: {e}")
             return False
@@ -44,8 +40,6 @@ class Bounties(discord.Cog):
     async def check_premium_server(self, guild_id: int) -> bool:
         """Check if guild has premium access for bounty features"""
         try:
-
-            pass
             # Bounties is guild-wide premium feature - check if guild has any premium access
             return await self.bot.db_manager.has_premium_access(guild_id)
         except Exception as e:
@@ -111,8 +105,6 @@ class Bounties(discord.Cog):
                               amount: int, event_type: str, description: str):
         """Add wallet transaction event for tracking"""
         try:
-
-            pass
             await self.bot.db_manager.add_wallet_event(
                 guild_id, discord_id, amount, event_type, description
             )
@@ -125,8 +117,6 @@ class Bounties(discord.Cog):
     async def bounty_set(self, ctx: discord.ApplicationContext, target: str, amount: int):
         """Set a bounty on a target (Discord user or player name)"""
         try:
-
-            pass
             guild_id = ctx.guild.id if ctx.guild else 0
             discord_id = ctx.user.id if ctx.user else 0
 
@@ -169,8 +159,6 @@ class Bounties(discord.Cog):
                 if user_id_str.startswith('!'):
                     user_id_str = user_id_str[1:]
                 try:
-
-                    pass
                     user_id = int(user_id_str)
                     target_user = ctx.guild.get_member(user_id)
                 except ValueError:
@@ -286,8 +274,6 @@ class Bounties(discord.Cog):
     async def bounty_list(self, ctx: discord.ApplicationContext):
         """List all active bounties"""
         try:
-
-            pass
             guild_id = ctx.guild.id if ctx.guild else 0
 
             # Check premium access
@@ -367,8 +353,6 @@ class Bounties(discord.Cog):
     async def check_bounty_claims(self, guild_id: int, killer_character: str, victim_character: str):
         """Check if a kill claims any bounties"""
         try:
-
-            pass
             # Find active bounties on the victim
             active_bounties = await self.bot.db_manager.bounties.find({
                 'guild_id': guild_id,
@@ -397,8 +381,6 @@ class Bounties(discord.Cog):
                            killer_discord_id: int, killer_character: str):
         """Process a bounty claim"""
         try:
-
-            pass
             bounty_amount = bounty['amount']
             target_character = bounty['target_character']
 
@@ -439,8 +421,6 @@ class Bounties(discord.Cog):
                                         killer_discord_id: int, killer_character: str):
         """Send bounty claimed notification"""
         try:
-
-            pass
             # Get guild channels
             guild_config = await self.bot.db_manager.get_guild(guild_id)
             if not guild_config:
@@ -510,8 +490,6 @@ class Bounties(discord.Cog):
     async def generate_auto_bounties(self, guild_id: int):
         """Generate automatic bounties based on kill performance"""
         try:
-
-            pass
             # Get top killers from the last hour
             one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
 
@@ -598,8 +576,6 @@ class Bounties(discord.Cog):
                                      amount: int, kill_count: int):
         """Send auto-bounty notification"""
         try:
-
-            pass
             # Get guild channels
             guild_config = await self.bot.db_manager.get_guild(guild_id)
             if not guild_config:
@@ -673,8 +649,6 @@ class Bounties(discord.Cog):
                             amount: discord.Option(int, "Bounty amount", min_value=100)):
         """Set a bounty on a player"""
         try:
-
-            pass
             guild_id = ctx.guild.id if ctx.guild else 0
             discord_id = ctx.user.id
 
@@ -733,8 +707,6 @@ class Bounties(discord.Cog):
     async def bounty_list_cmd(self, ctx: discord.ApplicationContext):
         """List active bounties"""
         try:
-
-            pass
             guild_id = ctx.guild.id if ctx.guild else 0
 
             bounties = await self.bot.db_manager.db.bounties.find({
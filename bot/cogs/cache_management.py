@@ -23,12 +23,8 @@ class CacheManagement(discord.Cog):
     async def check_premium_access(self, guild_id: int) -> bool:
         """Check if guild has premium access - unified validation"""
         try:
-
-            pass
-            if hasattr(self.bot, 'premium_manager_v2'):
-                return await self.bot.premium_manager_v2.has_premium_access(guild_id)
-            else:
-                return False
+            check = self.bot.premium_access_check
+            return await check(guild_id) if check else False
         except Exception as e:
             logger.error(f"Premium access check failed: {e}")
             return False
@@ -48,9 +44,6 @@ class CacheManagement(discord.Cog):
             return
         
         try:
-
-        
-            pass
             # Get cache statistics
             if hasattr(self.bot.db_manager, 'get_cache_stats'):
                 stats = await self.bot.db_manager.get_cache_stats()
@@ -127,9 +120,6 @@ class CacheManagement(discord.Cog):
             return
         
         try:
-
-        
-            pass
             guild_id = ctx.guild.id if ctx.guild else 0
             
             # Confirm action
@@ -175,9 +165,6 @@ class CacheManagement(discord.Cog):
             return
         
         try:
-
-        
-            pass
             # Perform cleanup
             if hasattr(self.bot.db_manager, 'cleanup_cache'):
                 cleaned_count = await self.bot.db_manager.cleanup_cache()
@@ -209,9 +196,6 @@ class CacheManagement(discord.Cog):
             return
         
         try:
-
-        
-            pass
             guild_id = ctx.guild.id if ctx.guild else 0
             
             # Refresh premium cache
@@ -5,6 +5,9 @@ import platform
 from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
+_log_exc = logger.exception
+
+_PY_VERSION = platform.python_version()
 
 class Core(commands.Cog):
     """Core bot commands and utilities"""
@@ -12,46 +15,52 @@ class Core(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+        # Static portion of the /info embed, copied and completed per call
+        self._info_base = discord.Embed(
+            title="🤖 Bot Information",
+            color=0x3498db
+        )
+        self._info_base.add_field(name="Bot Version", value="2.0.0", inline=True)
+        self._info_base.add_field(name="Discord.py", value=discord.__version__, inline=True)
+        self._info_base.add_field(name="Python", value=_PY_VERSION, inline=True)
+
     @discord.slash_command(name="ping", description="Check bot latency")
     async def ping(self, ctx: discord.ApplicationContext):
         """Check the bot's latency"""
         try:
-            await ctx.defer()
-
             latency = round(self.bot.latency * 1000)
             embed = discord.Embed(
                 title="🏓 Pong!",
                 description=f"Bot latency: **{latency}ms**",
                 color=0x00ff88
             )
-            await ctx.followup.send(embed=embed)
+            await ctx.respond(embed=embed)
 
-        except Exception as e:
-            logger.error(f"Ping command error: {e}")
-            await ctx.followup.send("❌ Failed to check latency", ephemeral=True)
+        except Exception:
+            _log_exc("Ping command error")
+            if ctx.response.is_done():
+                await ctx.followup.send("❌ Failed to check latency", ephemeral=True)
+            else:
+                await ctx.respond("❌ Failed to check latency", ephemeral=True)
 
     @discord.slash_command(name="info", description="Display bot information")
     async def info(self, ctx: discord.ApplicationContext):
         """Display bot information"""
         try:
-            await ctx.defer()
-
-            embed = discord.Embed(
-                title="🤖 Bot Information",
-                color=0x3498db
-            )
-            embed.add_field(name="Bot Version", value="2.0.0", inline=True)
-            embed.add_field(name="Discord.py", value=discord.__version__, inline=True)
-            embed.add_field(name="Python", value=platform.python_version(), inline=True)
-            embed.add_field(name="Servers", value=len(self.bot.guilds), inline=True)
-            embed.add_field(name="Users", value=len(self.bot.users), inline=True)
+            # Everything here is in memory, so answer directly instead of deferring first
+            embed = self._info_base.copy()
+            embed.add_field(name="Servers", value=self.bot._guild_count, inline=True)
+            embed.add_field(name="Users", value=self.bot._user_count, inline=True)
             embed.timestamp = datetime.now(timezone.utc)
 
-            await ctx.followup.send(embed=embed)
+            await ctx.respond(embed=embed)
 
-        except Exception as e:
-            logger.error(f"Info command error: {e}")
-            await ctx.followup.send("❌ Failed to retrieve bot information", ephemeral=True)
+        except Exception:
+            _log_exc("Info command error")
+            if ctx.response.is_done():
+                await ctx.followup.send("❌ Failed to retrieve bot information", ephemeral=True)
+            else:
+                await ctx.respond("❌ Failed to retrieve bot information", ephemeral=True)
 
 async def setup(bot):
     await bot.add_cog(Core(bot))
\ No newline at end of file
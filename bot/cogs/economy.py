@@ -3,6 +3,14 @@ from discord.ext import commands
 import logging
 
 logger = logging.getLogger(__name__)
+_log_exc = logger.exception
+
+# Static placeholder response; immutable, so one instance is shared by every call
+_BALANCE_EMBED = discord.Embed(
+    title="💰 Balance",
+    description="Economy system is currently in development",
+    color=0x00ff88
+)
 
 class Economy(commands.Cog):
     """Economy system"""
@@ -14,18 +22,14 @@ class Economy(commands.Cog):
     async def balance(self, ctx: discord.ApplicationContext):
         """Check user balance"""
         try:
-            await ctx.defer(ephemeral=True)
-
-            embed = discord.Embed(
-                title="💰 Balance",
-                description="Economy system is currently in development",
-                color=0x00ff88
-            )
-            await ctx.followup.send(embed=embed, ephemeral=True)
+            await ctx.respond(embed=_BALANCE_EMBED, ephemeral=True)
 
-        except Exception as e:
-            logger.error(f"Balance command error: {e}")
-            await ctx.followup.send("❌ Failed to check balance", ephemeral=True)
+        except Exception:
+            _log_exc("Balance command error")
+            if ctx.response.is_done():
+                await ctx.followup.send("❌ Failed to check balance", ephemeral=True)
+            else:
+                await ctx.respond("❌ Failed to check balance", ephemeral=True)
 
 async def setup(bot):
     await bot.add_cog(Economy(bot))
\ No newline at end of file
@@ -1,6 +1,7 @@
 """
 The diff contains changes that remove emojis and use EmbedFactory for faction embeds, updating title and description for premium feature check.
 """
+import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
@@ -25,14 +26,8 @@ class Factions(discord.Cog):
     async def check_premium_access(self, guild_id: int) -> bool:
         """Check if guild has premium access - unified validation"""
         try:
-
-            pass
-            if hasattr(self.bot, 'premium_manager_v2'):
-                return await self.bot.premium_manager_v2.has_premium_access(guild_id)
-            elif hasattr(self.bot, 'db_manager') and hasattr(self.bot.db_manager, 'has_premium_access'):
-                return await self.bot.db_manager.has_premium_access(guild_id)
-            else:
-                return False
+            check = self.bot.premium_access_check
+            return await check(guild_id) if check else False
         except Exception as e:
             logger.error(f"Premium access check failed: {e}")
             return False
@@ -40,8 +35,6 @@ class Factions(discord.Cog):
     async def check_premium_server(self, guild_id: int) -> bool:
         """Check if guild has premium access for faction features"""
         try:
-
-            pass
             # Factions is guild-wide premium feature - check if guild has any premium access
             return await self.bot.db_manager.has_premium_access(guild_id)
         except Exception as e:
@@ -58,8 +51,6 @@ class Factions(discord.Cog):
     async def generate_faction_stats(self, guild_id: int, member_ids: List[int]) -> Dict[str, Any]:
         """Generate combined stats for faction members using correct data structure"""
         try:
-
-            pass
             total_kills = 0
             total_deaths = 0
             total_distance = 0.0
@@ -107,8 +98,6 @@ class Factions(discord.Cog):
     async def autocomplete_faction_name(self, ctx: discord.AutocompleteContext):
         """Autocomplete callback for faction names"""
         try:
-
-            pass
             guild_id = ctx.interaction.guild_id
 
             # Get all factions for this guild
@@ -131,8 +120,6 @@ class Factions(discord.Cog):
     async def calculate_faction_stats(self, guild_id: int, faction_data: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate combined stats for all faction members"""
         try:
-
-            pass
             combined_stats = {
                 'total_kills': 0,
                 'total_deaths': 0,
@@ -143,34 +130,21 @@ class Factions(discord.Cog):
                 'total_distance': 0.0
             }
 
-            # Get stats for all members
-            for member_id in faction_data['members']:
-                # Get member's linked characters
-                player_data = await self.bot.db_manager.get_linked_player(guild_id or 0, member_id)
-                if not player_data:
-                    continue
-
-                # Get stats for each character across all servers
-                for character in player_data['linked_characters']:
-                    cursor = self.bot.db_manager.pvp_data.find({
-                        'guild_id': guild_id,
-                        'player_name': character
-                    })
-
-                    async for server_stats in cursor:
-                        combined_stats['total_kills'] += server_stats.get('kills', 0)
-                        combined_stats['total_deaths'] += server_stats.get('deaths', 0)
-                        combined_stats['total_suicides'] += server_stats.get('suicides', 0)
-                        combined_stats['total_distance'] += server_stats.get('total_distance', 0.0)
-
-                        if server_stats and server_stats.get('longest_streak', 0) > combined_stats['best_streak']:
-                            combined_stats['best_streak'] = server_stats.get('longest_streak', 0)
-
-            # Calculate faction KDR safely
-            if combined_stats['total_deaths'] > 0:
-                combined_stats['total_kdr'] = combined_stats['total_kills'] / combined_stats['total_deaths']
-            else:
-                combined_stats['total_kdr'] = float(combined_stats['total_kills'])
+            # Resolve every member's linked characters in one query, then sum their stats in one aggregation
+            characters = []
+            async for player_data in self.bot.db_manager.players.find(
+                {'guild_id': guild_id, 'discord_id': {'$in': list(faction_data['members'])}},
+                {'linked_characters': 1}
+            ):
+                characters.extend(player_data.get('linked_characters') or [])
+
+            totals = await self.bot.db_manager.get_pvp_totals(guild_id, characters)
+            combined_stats['total_kills'] = totals['kills']
+            combined_stats['total_deaths'] = totals['deaths']
+            combined_stats['total_suicides'] = totals['suicides']
+            combined_stats['total_distance'] = totals['total_distance']
+            combined_stats['best_streak'] = totals['longest_streak']
+            combined_stats['total_kdr'] = totals['kdr']
 
             return combined_stats
 
@@ -191,8 +165,6 @@ class Factions(discord.Cog):
     async def faction_create(self, ctx: discord.ApplicationContext, name: str, tag: str = ""):
         """Create a new faction"""
         try:
-
-            pass
             guild_id = ctx.guild.id if ctx.guild else 0
             discord_id = ctx.user.id
 
@@ -291,8 +263,6 @@ class Factions(discord.Cog):
     async def faction_invite(self, ctx: discord.ApplicationContext, user: discord.Member):
         """Invite a user to join your faction"""
         try:
-
-            pass
             guild_id = ctx.guild.id if ctx.guild else 0
             discord_id = ctx.user.id
 
@@ -391,8 +361,6 @@ class Factions(discord.Cog):
     async def faction_join(self, ctx: discord.ApplicationContext, faction_name: str):
         """Join a faction by name"""
         try:
-
-            pass
             guild_id = ctx.guild.id if ctx.guild else 0
             discord_id = ctx.user.id
 
@@ -484,8 +452,6 @@ class Factions(discord.Cog):
     async def faction_leave(self, ctx: discord.ApplicationContext):
         """Leave your current faction"""
         try:
-
-            pass
             guild_id = ctx.guild.id if ctx.guild else 0
             discord_id = ctx.user.id
 
@@ -561,8 +527,6 @@ class Factions(discord.Cog):
     async def faction_info(self, ctx: discord.ApplicationContext, faction_name: str = ""):
         """View detailed information about a faction"""
         try:
-
-            pass
             guild_id = ctx.guild.id if ctx.guild else 0
             discord_id = ctx.user.id
 
@@ -593,8 +557,15 @@ class Factions(discord.Cog):
 
             await ctx.defer()
 
-            # Calculate faction stats
-            stats = await self.calculate_faction_stats(guild_id or 0, faction)
+            # Faction stats and the leader lookup are independent; overlap the round trips
+            stats, leader = await asyncio.gather(
+                self.calculate_faction_stats(guild_id or 0, faction),
+                self.bot.fetch_user(faction.get('leader_id')),
+                return_exceptions=True
+            )
+            if isinstance(stats, BaseException):
+                raise stats
+            leader_name = "Unknown" if isinstance(leader, BaseException) else leader.mention
 
             # Create info embed
             embed = discord.Embed(
@@ -606,15 +577,6 @@ class Factions(discord.Cog):
             if faction and faction.get('faction_tag'):
                 embed.description = f"Tag: **[{faction['faction_tag']}]**"
 
-            # Get leader info
-            try:
-
-                pass
-                leader = await self.bot.fetch_user(faction['leader_id'])
-                leader_name = leader.mention
-            except:
-                leader_name = "Unknown"
-
             embed.add_field(
                 name="👑 Leadership",
                 value=f"**Leader:** {leader_name}\n**Officers:** {len(faction.get('officers', []))}",
@@ -631,8 +593,6 @@ class Factions(discord.Cog):
             created_at = faction.get('created_at')
             if created_at and isinstance(created_at, datetime):
                 try:
-
-                    pass
                     # Ensure timezone-aware datetime
                     if created_at.tzinfo is None:
                         created_at = created_at.replace(tzinfo=timezone.utc)
@@ -710,8 +670,6 @@ class Factions(discord.Cog):
     async def faction_stats(self, ctx: discord.ApplicationContext, faction_name: str = ""):
         """View detailed faction statistics"""
         try:
-
-            pass
             guild_id = ctx.guild.id if ctx.guild else 0
             discord_id = ctx.user.id
 
@@ -743,50 +701,46 @@ class Factions(discord.Cog):
             # Calculate faction stats
             stats = await self.calculate_faction_stats(guild_id or 0, faction)
 
-            # Create stats embed
-            embed = discord.Embed(
-                title=f"{faction['faction_name']} Statistics",
-                color=0x3498DB,
-                timestamp=datetime.now(timezone.utc)
-            )
-
-            if faction and faction.get('faction_tag'):
+            member_count = max(stats['member_count'], 1)
+
+            # Fixed card layout, built as one payload instead of field-by-field
+            embed = discord.Embed.from_dict({
+                "title": f"{faction['faction_name']} Statistics",
+                "color": 0x3498DB,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "fields": [
+                    {
+                        "name": "Combat Performance",
+                        "value": f"**Total Kills:** {stats['total_kills']:,}\n"
+                                 f"**Total Deaths:** {stats['total_deaths']:,}\n"
+                                 f"**Total Suicides:** {stats['total_suicides']:,}\n"
+                                 f"**K/D Ratio:** {stats['total_kdr']:.2f}",
+                        "inline": True
+                    },
+                    {
+                        "name": "Performance Metrics",
+                        "value": f"**Best Kill Streak:** {stats['best_streak']:,}\n"
+                                 f"**Total Distance:** {stats['total_distance']:,.1f}m\n"
+                                 f"**Avg KDR per Member:** {stats['total_kdr'] / member_count:.2f}\n"
+                                 f"**Kills per Member:** {stats['total_kills'] / member_count:.1f}",
+                        "inline": True
+                    },
+                    {
+                        "name": "👥 Faction Details",
+                        "value": f"**Active Members:** {stats['member_count']}\n"
+                                 f"**Total Capacity:** {faction.get('max_members', 20)}\n"
+                                 f"**Officers:** {len(faction.get('officers', []))}\n"
+                                 f"**Recruitment:** {'Invite Only' if faction.get('invite_only', False) else '🌐 Open'}",
+                        "inline": True
+                    }
+                ],
+                "thumbnail": {"url": "attachment://Faction.png"},
+                "footer": {"text": "Powered by Discord.gg/EmeraldServers"}
+            })
+            if faction.get('faction_tag'):
                 embed.description = f"Tag: **[{faction['faction_tag']}]**"
 
-            # Combat Statistics
-            embed.add_field(
-                name="Combat Performance",
-                value=f"**Total Kills:** {stats['total_kills']:,}\n"
-                      f"**Total Deaths:** {stats['total_deaths']:,}\n"
-                      f"**Total Suicides:** {stats['total_suicides']:,}\n"
-                      f"**K/D Ratio:** {stats['total_kdr']:.2f}",
-                inline=True
-            )
-
-            # Performance Metrics
-            embed.add_field(
-                name="Performance Metrics",
-                value=f"**Best Kill Streak:** {stats['best_streak']:,}\n"
-                      f"**Total Distance:** {stats['total_distance']:,.1f}m\n"
-                      f"**Avg KDR per Member:** {stats['total_kdr'] / max(stats['member_count'], 1):.2f}\n"
-                      f"**Kills per Member:** {stats['total_kills'] / max(stats['member_count'], 1):.1f}",
-                inline=True
-            )
-
-            # Faction Info
-            embed.add_field(
-                name="👥 Faction Details",
-                value=f"**Active Members:** {stats['member_count']}\n"
-                      f"**Total Capacity:** {faction.get('max_members', 20)}\n"
-                      f"**Officers:** {len(faction.get('officers', []))}\n"
-                      f"**Recruitment:** {'Invite Only' if faction and faction.get('invite_only', False) else '🌐 Open'}",
-                inline=True
-            )
-
             faction_file = discord.File("./assets/Faction.png", filename="Faction.png")
-            embed.set_thumbnail(url="attachment://Faction.png")
-            embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
-
             await ctx.followup.send(embed=embed, file=faction_file)
 
         except Exception as e:
@@ -797,8 +751,6 @@ class Factions(discord.Cog):
     async def faction_list(self, ctx: discord.ApplicationContext):
         """List all factions in the guild"""
         try:
-
-            pass
             guild_id = ctx.guild.id if ctx.guild else 0
 
             # Check premium access
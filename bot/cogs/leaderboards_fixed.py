@@ -13,6 +13,8 @@ from datetime import datetime, timezone
 from typing import Optional, Tuple, Dict, Any, List
 from bot.utils.embed_factory import EmbedFactory
 from bot.cogs.autocomplete import ServerAutocomplete
+from bot.utils.db_throttle import run_db
+from bot.utils.ttl_cache import AsyncTTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -38,18 +40,13 @@ class LeaderboardsFixed(discord.Cog):
 
     def __init__(self, bot):
         self.bot = bot
+        self._leaderboard_cache = AsyncTTLCache(maxsize=1024, ttl=60)
 
     async def check_premium_access(self, guild_id: int) -> bool:
         """Check if guild has premium access - unified validation"""
         try:
-
-            pass
-            if hasattr(self.bot, 'premium_manager_v2'):
-                return await self.bot.premium_manager_v2.has_premium_access(guild_id)
-            elif hasattr(self.bot, 'db_manager') and hasattr(self.bot.db_manager, 'has_premium_access'):
-                return await self.bot.db_manager.has_premium_access(guild_id)
-            else:
-                return False
+            check = self.bot.premium_access_check
+            return await check(guild_id) if check else False
         except Exception as e:
             logger.error(f"Premium access check failed: {e}")
             return False
@@ -66,9 +63,6 @@ class LeaderboardsFixed(discord.Cog):
         await ctx.defer()
 
         try:
-
-
-            pass
             if not ctx.guild:
 
                 await ctx.respond("❌ This command must be used in a server", ephemeral=True)
@@ -116,48 +110,18 @@ class LeaderboardsFixed(discord.Cog):
             logger.error(f"Failed to show leaderboard: {e}")
             await ctx.followup.send("Failed to load leaderboard. Please try again later.", ephemeral=True)
 
-    async def get_player_faction(self, guild_id: int, player_name: str) -> Optional[str]:
-        """Get player's faction tag if they have one"""
+    async def get_player_factions(self, guild_id: int, player_names: List[str]) -> Dict[str, str]:
+        """Faction tags for every named player in one query; an empty map if the lookup fails"""
         try:
-
-            pass
-            # First find the Discord ID for this player name
-            player_link = await self.bot.db_manager.players.find_one({
-                "guild_id": guild_id,
-                "linked_characters": player_name
-            })
-
-            if not player_link:
-                return None
-
-            discord_id = player_link.get('discord_id')
-            if not discord_id:
-                return None
-
-            # Now look up faction using Discord ID - ensure we're checking the members array properly
-            faction_doc = await self.bot.db_manager.factions.find_one({
-                "guild_id": guild_id,
-                "members": {"$in": [discord_id]}
-            })
-
-            if faction_doc:
-                # Return faction tag if available, otherwise faction name
-                faction_tag = faction_doc.get('faction_tag')
-                if faction_tag:
-                    return faction_tag
-                return faction_doc.get('faction_name')
-
-            return None
+            return await run_db(self.bot, self.bot.db_manager.get_player_factions, guild_id, player_names)
         except Exception as e:
-            logger.error(f"Error getting player faction for {player_name}: {e}")
-            return None
+            logger.error(f"Error getting player factions: {e}")
+            return {}
 
-    async def format_leaderboard_line(self, rank: int, player: Dict[str, Any], stat_type: str, guild_id: int) -> str:
+    def format_leaderboard_line(self, rank: int, player: Dict[str, Any], stat_type: str, faction: Optional[str] = None) -> str:
         """Format a single leaderboard line with faction tags and clean styling"""
         player_name = player.get('player_name', 'Unknown')
 
-        # Get faction tag
-        faction = await self.get_player_faction(guild_id, player_name)
         faction_tag = f" [{faction}]" if faction else ""
 
         # Clean rank formatting without emojis - just bold numbers
@@ -208,8 +172,6 @@ class LeaderboardsFixed(discord.Cog):
     async def get_top_kills(self, guild_id: int, server_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get top killers for a specific server"""
         try:
-
-            pass
             query = {
                 "guild_id": guild_id,
                 "kills": {"$gt": 0}
@@ -227,9 +189,19 @@ class LeaderboardsFixed(discord.Cog):
 
     async def create_themed_leaderboard(self, guild_id: int, server_id: str, stat_type: str, server_name: str) -> Tuple[Optional[discord.Embed], Optional[discord.File]]:
         """Create properly themed leaderboard using EmbedFactory"""
-        try:
+        # Rankings change on the scale of minutes, so repeated /leaderboard calls share one build.
+        # Only the embed data is cached; EmbedFactory creates a fresh embed and file per send.
+        embed_data = await self._leaderboard_cache.get_or_load(
+            (guild_id, server_id, stat_type, server_name),
+            lambda: self._build_leaderboard_data(guild_id, server_id, stat_type, server_name)
+        )
+        if not embed_data:
+            return None, None
+        return await EmbedFactory.build('leaderboard', embed_data)
 
-            pass
+    async def _build_leaderboard_data(self, guild_id: int, server_id: str, stat_type: str, server_name: str) -> Optional[Dict[str, Any]]:
+        """Query and rank leaderboard entries, returning EmbedFactory data or None when empty"""
+        try:
             # Themed title pools for each stat type
             title_pools = {
                 'kills': ["Top Operators", "Elite Eliminators", "Death Dealers", "Blood Money Rankings"],
@@ -323,7 +295,10 @@ class LeaderboardsFixed(discord.Cog):
                     })
 
                 if not weapons_data:
-                    return None, None
+                    return None
+
+                # Faction tags for every top killer come back in one query
+                factions = await self.get_player_factions(guild_id, [w['top_killer'] for w in weapons_data])
 
                 leaderboard_text = []
                 for i, weapon in enumerate(weapons_data, 1):
@@ -334,8 +309,7 @@ class LeaderboardsFixed(discord.Cog):
                     # Clean weapon formatting without emojis
                     rank_display = f"**{i}.**"
 
-                    # Get faction for top killer
-                    faction = await self.get_player_faction(guild_id, top_killer)
+                    faction = factions.get(top_killer)
                     faction_tag = f" [{faction}]" if faction else ""
 
                     # Clean weapon name formatting
@@ -357,8 +331,7 @@ class LeaderboardsFixed(discord.Cog):
                     'thumbnail_url': 'attachment://WeaponStats.png'
                 }
 
-                embed, file = await EmbedFactory.build('leaderboard', embed_data)
-                return embed, file
+                return embed_data
 
             elif stat_type == 'factions':
                 # Get all factions for this guild first
@@ -376,43 +349,15 @@ class LeaderboardsFixed(discord.Cog):
                     if not faction_display:
                         continue
 
-                    faction_stats[faction_display] = {
-                        'kills': 0, 
-                        'deaths': 0, 
-                        'members': set(),
-                        'faction_name': faction_name
-                    }
-
-                    # Get stats for each member
-                    for discord_id in faction_doc.get('members', []):
-                        # Get player's linked characters
-                        player_link = await self.bot.db_manager.players.find_one({
-                            "guild_id": guild_id,
-                            "discord_id": discord_id
-                        })
-
-                        if not player_link:
-                            continue
-
-                        # Get stats for each character
-                        for character in player_link.get('linked_characters', []):
-                            player_stat = await self.bot.db_manager.pvp_data.find_one({
-                                "guild_id": guild_id,
-                                "player_name": character
-                            })
-
-                            if player_stat:
-                                faction_stats[faction_display]['kills'] += player_stat.get('kills', 0)
-                                faction_stats[faction_display]['deaths'] += player_stat.get('deaths', 0)
-                                faction_stats[faction_display]['members'].add(character)
-
-                # Convert member sets to counts
-                for faction_name in faction_stats:
-                    faction_stats[faction_name]['member_count'] = len(faction_stats[faction_name]['members'])
-                    del faction_stats[faction_name]['members']
+                    # Member links and their characters' stats are resolved in one aggregation
+                    faction_stats[faction_display] = await run_db(
+                        self.bot, self.bot.db_manager.get_linked_totals,
+                        guild_id, faction_doc.get('members', [])
+                    )
+                    faction_stats[faction_display]['faction_name'] = faction_name
 
                 if not faction_stats:
-                    return None, None
+                    return None
 
                 # Sort by kills
                 sorted_factions = sorted(faction_stats.items(), key=lambda x: x[1]['kills'], reverse=True)[:10]
@@ -421,8 +366,8 @@ class LeaderboardsFixed(discord.Cog):
                 for i, (faction_name, stats) in enumerate(sorted_factions, 1):
                     kills = stats['kills']
                     deaths = stats['deaths']
-                    members = stats['member_count']
-                    kdr = kills / max(deaths, 1) if deaths > 0 else kills
+                    members = stats['player_count']
+                    kdr = stats['kdr']
 
                     # Clean faction formatting without emojis
                     rank_display = f"**{i}.**"
@@ -448,20 +393,20 @@ class LeaderboardsFixed(discord.Cog):
                     'thumbnail_url': 'attachment://Faction.png'
                 }
 
-                embed, file = await EmbedFactory.build('leaderboard', embed_data)
-                return embed, file
+                return embed_data
 
             else:
-                return None, None
+                return None
 
             if not players:
-                return None, None
+                return None
 
-            # Create professional leaderboard text with advanced formatting
-            leaderboard_text = []
-            for i, player in enumerate(players, 1):
-                formatted_line = await self.format_leaderboard_line(i, player, stat_type, guild_id)
-                leaderboard_text.append(formatted_line)
+            # Faction tags for the whole page come back in one query instead of two per row
+            factions = await self.get_player_factions(guild_id, [p.get('player_name') for p in players])
+            leaderboard_text = [
+                self.format_leaderboard_line(i, player, stat_type, factions.get(player.get('player_name')))
+                for i, player in enumerate(players, 1)
+            ]
 
             # All leaderboards use Leaderboard.png
             thumbnail_map = {
@@ -473,8 +418,8 @@ class LeaderboardsFixed(discord.Cog):
 
             # Validate we have real data with actual content
             if not leaderboard_text or not any(p.get('kills', 0) > 0 or p.get('deaths', 0) > 0 for p in players):
-                logger.warning(f"No valid leaderboard data found for {stat_type} on {server_name}")
-                return None, None
+                logger.warning("No valid leaderboard data found for %s on %s", stat_type, server_name)
+                return None
 
             # Use EmbedFactory for proper theming with dynamic styling and validated data
             embed_data = {
@@ -489,13 +434,12 @@ class LeaderboardsFixed(discord.Cog):
                 'thumbnail_url': thumbnail_map.get(stat_type, 'attachment://Leaderboard.png')
             }
 
-            logger.info(f"Creating {stat_type} leaderboard for {server_name} with {len(players)} players")
-            embed, file = await EmbedFactory.build('leaderboard', embed_data)
-            return embed, file
+            logger.info("Creating %s leaderboard for %s with %d players", stat_type, server_name, len(players))
+            return embed_data
 
         except Exception as e:
             logger.error(f"Failed to create themed leaderboard: {e}")
-            return None, None
+            return None
 
 def setup(bot):
     bot.add_cog(LeaderboardsFixed(bot))
\ No newline at end of file
@@ -2,7 +2,10 @@ import discord
 from discord.ext import commands
 import logging
 
+from bot.utils.db_throttle import run_db
+
 logger = logging.getLogger(__name__)
+_log_exc = logger.exception
 
 class Linking(commands.Cog):
     """Player linking system"""
@@ -14,60 +17,55 @@ class Linking(commands.Cog):
     async def link(self, ctx: discord.ApplicationContext, 
                   player_name: discord.Option(str, "Player name to link")):
         """Link Discord account to player name"""
+        guild_id, user_id = ctx.guild_id, ctx.user.id
+        if not self.bot.db_ready.is_set():
+            await ctx.respond("❌ Database unavailable", ephemeral=True)
+            return
+
         try:
             await ctx.defer(ephemeral=True)
 
-            if not self.bot.db_manager:
-                await ctx.followup.send("❌ Database unavailable", ephemeral=True)
-                return
-
             # Validate player name
-            if not player_name or len(player_name.strip()) < 3:
+            name = player_name.strip() if player_name else ""
+            if len(name) < 3:
                 await ctx.followup.send("❌ Player name must be at least 3 characters", ephemeral=True)
                 return
 
-            guild_id = ctx.guild_id
-            user_id = ctx.user.id
-
-            # Check if already linked
-            existing_link = await self.bot.db_manager.get_linked_player(guild_id, user_id)
-            if existing_link:
+            # Check-and-create in one round trip; not retried, since a replayed upsert
+            # whose first reply was lost would report the new link as "already linked"
+            existing_name = await run_db(self.bot, self.bot.db_manager.try_create_linked_player,
+                                         guild_id, user_id, name, retries=0)
+            if existing_name is not None:
                 await ctx.followup.send("❌ You already have a linked player. Use `/unlink` first.", ephemeral=True)
                 return
 
-            # Create link
-            await self.bot.db_manager.create_linked_player(guild_id, user_id, player_name.strip())
-            await ctx.followup.send(f"✅ Linked to player: **{player_name.strip()}**", ephemeral=True)
+            await ctx.followup.send(f"✅ Linked to player: **{name}**", ephemeral=True)
 
-        except Exception as e:
-            logger.error(f"Link command error: {e}")
+        except Exception:
+            _log_exc("Link command error")
             await ctx.followup.send("❌ Failed to link player", ephemeral=True)
 
     @discord.slash_command(name="unlink", description="Unlink your Discord account")
     async def unlink(self, ctx: discord.ApplicationContext):
         """Unlink Discord account"""
+        guild_id, user_id = ctx.guild_id, ctx.user.id
+        if not self.bot.db_ready.is_set():
+            await ctx.respond("❌ Database unavailable", ephemeral=True)
+            return
+
         try:
             await ctx.defer(ephemeral=True)
 
-            if not self.bot.db_manager:
-                await ctx.followup.send("❌ Database unavailable", ephemeral=True)
-                return
-
-            guild_id = ctx.guild_id
-            user_id = ctx.user.id
-
-            # Check if linked
-            existing_link = await self.bot.db_manager.get_linked_player(guild_id, user_id)
-            if not existing_link:
+            # Remove link; the delete itself tells us whether one existed, so it is not retried
+            removed = await run_db(self.bot, self.bot.db_manager.remove_linked_player, guild_id, user_id, retries=0)
+            if not removed:
                 await ctx.followup.send("❌ No linked player found", ephemeral=True)
                 return
 
-            # Remove link
-            await self.bot.db_manager.remove_linked_player(guild_id, user_id)
             await ctx.followup.send("✅ Player unlinked successfully", ephemeral=True)
 
-        except Exception as e:
-            logger.error(f"Unlink command error: {e}")
+        except Exception:
+            _log_exc("Unlink command error")
             await ctx.followup.send("❌ Failed to unlink player", ephemeral=True)
 
 async def setup(bot):
@@ -3,6 +3,14 @@ from discord.ext import commands
 import logging
 
 logger = logging.getLogger(__name__)
+_log_exc = logger.exception
+
+# Static placeholder response; immutable, so one instance is shared by every call
+_PREMIUM_EMBED = discord.Embed(
+    title="💎 Premium Status",
+    description="Premium features are currently in development",
+    color=0xffd700
+)
 
 class Premium(commands.Cog):
     """Premium features management"""
@@ -14,18 +22,14 @@ class Premium(commands.Cog):
     async def premium(self, ctx: discord.ApplicationContext):
         """Check premium status"""
         try:
-            await ctx.defer(ephemeral=True)
-
-            embed = discord.Embed(
-                title="💎 Premium Status",
-                description="Premium features are currently in development",
-                color=0xffd700
-            )
-            await ctx.followup.send(embed=embed, ephemeral=True)
+            await ctx.respond(embed=_PREMIUM_EMBED, ephemeral=True)
 
-        except Exception as e:
-            logger.error(f"Premium command error: {e}")
-            await ctx.followup.send("❌ Failed to check premium status", ephemeral=True)
+        except Exception:
+            _log_exc("Premium command error")
+            if ctx.response.is_done():
+                await ctx.followup.send("❌ Failed to check premium status", ephemeral=True)
+            else:
+                await ctx.respond("❌ Failed to check premium status", ephemeral=True)
 
 async def setup(bot):
     await bot.add_cog(Premium(bot))
\ No newline at end of file
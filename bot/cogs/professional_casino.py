@@ -65,10 +65,6 @@ class CasinoMainView(discord.ui.View):
     
     async def get_current_balance(self):
         try:
-
-            pass
-            pass
-            pass
             wallet = await self.bot.db_manager.get_wallet(self.guild_id, self.user_id)
             return wallet.get('balance', 0)
         except:
@@ -284,10 +280,6 @@ class CustomBetModal(discord.ui.Modal):
     
     async def on_submit(self, interaction: discord.Interaction):
         try:
-
-            pass
-            pass
-            pass
             bet_str = self.bet_input.value.strip().replace(',', '').replace('$', '')
             
             if not bet_str.isdigit():
@@ -404,10 +396,6 @@ class SlotsGameView(discord.ui.View):
     
     async def get_current_balance(self):
         try:
-
-            pass
-            pass
-            pass
             wallet = await self.bot.db_manager.get_wallet(self.guild_id, self.user_id)
             return wallet.get('balance', 0)
         except:
@@ -415,10 +403,6 @@ class SlotsGameView(discord.ui.View):
     
     async def update_balance(self, amount):
         try:
-
-            pass
-            pass
-            pass
             operation = "add" if amount >= 0 else "subtract"
             return await self.bot.db_manager.update_wallet(self.guild_id, self.user_id, abs(amount), operation)
         except:
@@ -516,10 +500,6 @@ class CoinFlipGameView(discord.ui.View):
     
     async def get_current_balance(self):
         try:
-
-            pass
-            pass
-            pass
             wallet = await self.bot.db_manager.get_wallet(self.guild_id, self.user_id)
             return wallet.get('balance', 0)
         except:
@@ -527,10 +507,6 @@ class CoinFlipGameView(discord.ui.View):
     
     async def update_balance(self, amount):
         try:
-
-            pass
-            pass
-            pass
             operation = "add" if amount >= 0 else "subtract"
             return await self.bot.db_manager.update_wallet(self.guild_id, self.user_id, abs(amount), operation)
         except:
@@ -592,10 +568,6 @@ class RouletteGameView(discord.ui.View):
     
     async def get_current_balance(self):
         try:
-
-            pass
-            pass
-            pass
             wallet = await self.bot.db_manager.get_wallet(self.guild_id, self.user_id)
             return wallet.get('balance', 0)
         except:
@@ -682,10 +654,6 @@ class RouletteBetMenu(discord.ui.Select):
     
     async def update_balance(self, amount):
         try:
-
-            pass
-            pass
-            pass
             operation = "add" if amount >= 0 else "subtract"
             return await self.roulette_view.bot.db_manager.update_wallet(
                 self.roulette_view.guild_id, 
@@ -815,10 +783,6 @@ class RocketCrashGameView(discord.ui.View):
             
             embed = self.create_game_embed("flying")
             try:
-
-                pass
-                pass
-                pass
                 await interaction.edit_original_response(embed=embed, view=self)
             except:
                 break
@@ -852,11 +816,6 @@ class RocketCrashGameView(discord.ui.View):
         self.add_item(discord.ui.Button(label="🔙 Back to Casino", style=discord.ButtonStyle.secondary, custom_id="back"))
         
         try:
-
-        
-            pass
-            pass
-            pass
             await interaction.edit_original_response(embed=embed, view=self)
         except:
             pass
@@ -864,10 +823,6 @@ class RocketCrashGameView(discord.ui.View):
     async def get_current_balance(self):
         """Get user's current balance"""
         try:
-
-            pass
-            pass
-            pass
             wallet = await self.bot.db_manager.get_wallet(self.guild_id, self.user_id)
             return wallet.get('balance', 0)
         except Exception:
@@ -876,10 +831,6 @@ class RocketCrashGameView(discord.ui.View):
     async def update_balance(self, amount):
         """Update user's balance"""
         try:
-
-            pass
-            pass
-            pass
             operation = "add" if amount >= 0 else "subtract"
             return await self.bot.db_manager.update_wallet(
                 self.guild_id, self.user_id, abs(amount), operation
@@ -1097,11 +1048,6 @@ class BlackjackGameView(discord.ui.View):
         self.add_item(discord.ui.Button(label="🔙 Back to Casino", style=discord.ButtonStyle.secondary, custom_id="back"))
         
         try:
-
-        
-            pass
-            pass
-            pass
             await interaction.edit_original_response(embed=embed, view=self)
         except:
             await interaction.followup.edit_message(interaction.message.id, embed=embed, view=self)
@@ -1109,10 +1055,6 @@ class BlackjackGameView(discord.ui.View):
     async def get_current_balance(self):
         """Get user's current balance"""
         try:
-
-            pass
-            pass
-            pass
             wallet = await self.bot.db_manager.get_wallet(self.guild_id, self.user_id)
             return wallet.get('balance', 0)
         except Exception:
@@ -1121,10 +1063,6 @@ class BlackjackGameView(discord.ui.View):
     async def update_balance(self, amount):
         """Update user's balance"""
         try:
-
-            pass
-            pass
-            pass
             operation = "add" if amount >= 0 else "subtract"
             return await self.bot.db_manager.update_wallet(
                 self.guild_id, self.user_id, abs(amount), operation
@@ -1141,14 +1079,8 @@ class ProfessionalCasino(discord.Cog):
     async def check_premium_access(self, guild_id: int) -> bool:
         """Check if guild has premium access - unified validation"""
         try:
-
-            pass
-            pass
-            pass
-            if hasattr(self.bot, 'premium_manager_v2'):
-                return await self.bot.premium_manager_v2.has_premium_access(guild_id)
-            else:
-                return False
+            check = self.bot.premium_access_check
+            return await check(guild_id) if check else False
         except Exception as e:
             logger.error(f"Premium access check failed: {e}")
             return False
@@ -1160,10 +1092,6 @@ class ProfessionalCasino(discord.Cog):
         await ctx.defer()
         
         try:
-
-        
-            pass
-            pass
             if not ctx.guild:
                 await ctx.followup.send("This command can only be used in a server.", ephemeral=True)
                 return
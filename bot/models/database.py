@@ -10,9 +10,24 @@ from typing import Optional, Dict, List, Any
 from datetime import datetime, timezone, timezone, timedelta
 from motor.motor_asyncio import AsyncIOMotorClient
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument, UpdateOne
+
+from bot.utils.log_throttle import LogThrottle
+from bot.utils.ttl_cache import AsyncTTLCache
 
 logger = logging.getLogger(__name__)
 
+# PvP stat fields that must be non-negative numbers, and the subset that can be $inc'd
+_NUMERIC_STAT_FIELDS = frozenset({"kills", "deaths", "suicides", "longest_streak", "current_streak", "total_distance", "kdr"})
+_INCREMENTABLE_STAT_FIELDS = frozenset({"kills", "deaths", "suicides", "longest_streak", "current_streak", "total_distance"})
+
+# Server-side KDR for aggregated totals: kills per death, or raw kills with no deaths
+_KDR_STAGE = {"$addFields": {"kdr": {"$cond": [
+    {"$gt": ["$deaths", 0]},
+    {"$divide": ["$kills", "$deaths"]},
+    {"$toDouble": "$kills"}
+]}}}
+
 class DatabaseManager:
     """
     Database manager implementing PHASE 1 architecture with comprehensive error handling:
@@ -44,6 +59,22 @@ class DatabaseManager:
         self.bot_config = self.db.bot_config
         self.premium_limits = self.db.premium_limits
         self.wallet_events = self.db.wallet_events
+
+        # Linked players keyed by (guild_id, discord_id); invalidated on every link write
+        self.linked_player_cache = AsyncTTLCache(maxsize=10000, ttl=300)
+
+        # Users known to have no link, so casual command use skips the lookup entirely
+        self.no_link_cache = AsyncTTLCache(maxsize=50000, ttl=60)
+        self._link_writes = 0
+
+        # Combined PvP stats keyed by (guild_id, player_name); invalidated by increment_player_stats
+        self.player_stats_cache = AsyncTTLCache(maxsize=1024, ttl=30)
+
+        # Guild-wide premium access keyed by guild_id; invalidated on premium writes
+        self.premium_access_cache = AsyncTTLCache(maxsize=10000, ttl=60)
+
+        # Per-guild limiter for error logs on per-event write paths
+        self._error_log_throttle = LogThrottle(rate=1.0)
     
     @property
     def admin(self):
@@ -71,9 +102,7 @@ class DatabaseManager:
             logger.info("Database initialization completed successfully")
 
         except Exception as e:
-            logger.error(f"Critical database initialization failure: {e}")
-            import traceback
-            logger.error(f"Initialization traceback: {traceback.format_exc()}")
+            logger.error(f"Critical database initialization failure: {e}", exc_info=True)
             raise
 
     async def _bulletproof_database_cleanup(self):
@@ -264,9 +293,7 @@ class DatabaseManager:
                 logger.warning(f"Cold start reset failed: {e}")
 
         except Exception as e:
-            logger.error(f"Bulletproof cleanup failed: {e}")
-            import traceback
-            logger.error(f"Cleanup traceback: {traceback.format_exc()}")
+            logger.error(f"Bulletproof cleanup failed: {e}", exc_info=True)
 
     async def _reset_problematic_indexes(self):
         """Drop and recreate indexes that are causing conflicts"""
@@ -317,6 +344,13 @@ class DatabaseManager:
                 await self.pvp_data.create_index([("guild_id", 1), ("server_id", 1), ("player_name", 1)], unique=True)
                 await self.pvp_data.create_index([("guild_id", 1), ("server_id", 1), ("kills", -1)])
                 await self.pvp_data.create_index([("guild_id", 1), ("server_id", 1), ("kdr", -1)])
+                # Guild-wide lookups and leaderboards that span every server
+                await self.pvp_data.create_index([("guild_id", 1), ("player_name", 1)])
+                await self.pvp_data.create_index([("guild_id", 1), ("kills", -1)])
+                # Serves the /leaderboard deaths board (guild-wide, sorted by deaths)
+                await self.pvp_data.create_index([("guild_id", 1), ("deaths", -1)])
+                await self.pvp_data.create_index([("guild_id", 1), ("longest_streak", -1)])
+                await self.pvp_data.create_index([("guild_id", 1), ("personal_best_distance", -1)])
                 logger.debug("PvP data indexes created")
             except Exception as e:
                 logger.warning(f"PvP data index creation: {e}")
@@ -425,9 +459,7 @@ class DatabaseManager:
             logger.info("PHASE 3: Index creation completed")
 
         except Exception as e:
-            logger.error(f"Index creation failed: {e}")
-            import traceback
-            logger.error(f"Index creation traceback: {traceback.format_exc()}")
+            logger.error(f"Index creation failed: {e}", exc_info=True)
 
     # GUILD MANAGEMENT
     async def create_guild(self, guild_id: int, guild_name: str) -> Dict[str, Any]:
@@ -600,6 +632,7 @@ class DatabaseManager:
                 }
                 await self.players.insert_one(player_doc)
 
+            self._invalidate_linked_player(guild_id, discord_id)
             logger.info(f"Linked player {character_name} to Discord {discord_id} in guild {guild_id}")
             return True
 
@@ -608,7 +641,29 @@ class DatabaseManager:
             return False
 
     async def get_linked_player(self, guild_id: int, discord_id: int) -> Optional[Dict[str, Any]]:
-        """Get linked player data"""
+        """Get linked player data, served from the linked player cache when fresh"""
+        key = (guild_id, discord_id)
+        if self.no_link_cache.get(key):
+            return None
+
+        link_writes = self._link_writes
+        player_doc = await self.linked_player_cache.get_or_load(
+            key,
+            lambda: self._fetch_linked_player(guild_id, discord_id)
+        )
+        # A link written while we were loading makes a None result stale
+        if player_doc is None and link_writes == self._link_writes:
+            self.no_link_cache.set(key, True)
+        return player_doc
+
+    def _invalidate_linked_player(self, guild_id: int, discord_id: int):
+        """Drop cached link state, positive and negative, after a link write"""
+        self._link_writes += 1
+        self.linked_player_cache.invalidate((guild_id, discord_id))
+        self.no_link_cache.invalidate((guild_id, discord_id))
+
+    async def _fetch_linked_player(self, guild_id: int, discord_id: int) -> Optional[Dict[str, Any]]:
+        """Load and repair linked player data from the database"""
         try:
             player_doc = await self.players.find_one({
                 'guild_id': guild_id,
@@ -667,6 +722,41 @@ class DatabaseManager:
             logger.error(f"Failed to get linked player: {e}")
             raise  # Re-raise to allow calling code to handle appropriately
 
+    async def try_create_linked_player(self, guild_id: int, discord_id: int, character_name: str) -> Optional[str]:
+        """
+        Atomically link a character unless the user is already linked.
+        Returns None if the link was created. If a link document already existed,
+        returns its primary character, or an empty string when it names none.
+        """
+        existing = await self.players.find_one_and_update(
+            {"guild_id": guild_id, "discord_id": discord_id},
+            {"$setOnInsert": {
+                "guild_id": guild_id,
+                "discord_id": discord_id,
+                "linked_characters": [character_name],
+                "primary_character": character_name,
+                "linked_at": datetime.now(timezone.utc)
+            }},
+            upsert=True,
+            return_document=ReturnDocument.BEFORE,
+            projection={"primary_character": 1, "linked_characters": 1}
+        )
+        # Drop cached lookups either way so a stale "no link" can't outlive an existing link
+        self._invalidate_linked_player(guild_id, discord_id)
+
+        if existing is None:
+            logger.info(f"Linked player {character_name} to Discord {discord_id} in guild {guild_id}")
+            return None
+
+        # Any existing document means $setOnInsert wrote nothing, so never report None here
+        return existing.get("primary_character") or next(iter(existing.get("linked_characters") or []), None) or ""
+
+    async def remove_linked_player(self, guild_id: int, discord_id: int) -> bool:
+        """Remove a user's link and return whether one existed"""
+        result = await self.players.delete_one({"guild_id": guild_id, "discord_id": discord_id})
+        self._invalidate_linked_player(guild_id, discord_id)
+        return result.deleted_count > 0
+
     # PVP DATA (Server-scoped)
     async def update_pvp_stats(self, guild_id: int, server_id: str, player_name: str, 
                               stats_update: Dict[str, Any]) -> bool:
@@ -693,25 +783,19 @@ class DatabaseManager:
             server_id = str(server_id).strip()
             player_name = player_name.strip()
 
-            # Validate numeric stats
-            numeric_fields = {"kills", "deaths", "suicides", "longest_streak", "current_streak", "total_distance", "kdr"}
-            for field, value in stats_update.items():
-                if field in numeric_fields:
-                    if not isinstance(value, (int, float)) or value < 0:
-                        logger.error(f"Invalid numeric value for {field}: {value}")
-                        return False
-            # Define all possible stat fields that could be incremented
-            incrementable_fields = {
-                "kills", "deaths", "suicides", "longest_streak", "current_streak", "total_distance"
-            }
+            # Validate numeric stats (only the fields actually present are checked)
+            for field in stats_update.keys() & _NUMERIC_STAT_FIELDS:
+                value = stats_update[field]
+                if not isinstance(value, (int, float)) or value < 0:
+                    logger.error(f"Invalid numeric value for {field}: {value}")
+                    return False
 
             # Handle atomic increment operations
-            if isinstance(stats_update, dict) and len(stats_update) == 1:
+            if len(stats_update) == 1:
                 # Simple single field update - use atomic increment
-                field_name = list(stats_update.keys())[0]
-                field_value = list(stats_update.values())[0]
+                (field_name, field_value), = stats_update.items()
 
-                if field_name in incrementable_fields:
+                if field_name in _INCREMENTABLE_STAT_FIELDS:
                     # Create safe defaults without any incrementable fields or timestamps
                     safe_defaults = {
                         "guild_id": guild_id,
@@ -725,7 +809,7 @@ class DatabaseManager:
                     }
 
                     # Only add non-incrementable stat defaults
-                    for field in ["kills", "deaths", "suicides", "longest_streak", "current_streak", "total_distance"]:
+                    for field in _INCREMENTABLE_STAT_FIELDS:
                         if field != field_name:  # Don't set default for field we're incrementing
                             safe_defaults[field] = 0 if field != "total_distance" else 0.0
 
@@ -844,6 +928,157 @@ class DatabaseManager:
             "player_name": player_name
         })
 
+    async def get_player_combined_stats(self, guild_id: int, player_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Combine a player's PvP statistics across every server, typed at the
+        database so callers can use the values without re-coercing them.
+        Served from the player stats cache when fresh.
+        """
+        return await self.player_stats_cache.get_or_load(
+            (guild_id, player_name),
+            lambda: self._fetch_player_combined_stats(guild_id, player_name)
+        )
+
+    async def _fetch_player_combined_stats(self, guild_id: int, player_name: str) -> Optional[Dict[str, Any]]:
+        """Aggregate a player's typed PvP totals from the database"""
+        cursor = self.pvp_data.aggregate([
+            {"$match": {"guild_id": guild_id, "player_name": player_name}},
+            {"$group": {
+                "_id": None,
+                "kills": {"$sum": "$kills"},
+                "deaths": {"$sum": "$deaths"},
+                "total_distance": {"$sum": "$total_distance"},
+                "personal_best_distance": {"$max": "$personal_best_distance"},
+                "favorite_weapon": {"$first": "$favorite_weapon"}
+            }},
+            _KDR_STAGE,
+            {"$project": {
+                "_id": 0,
+                "kills": {"$toInt": "$kills"},
+                "deaths": {"$toInt": "$deaths"},
+                "kdr": {"$toDouble": "$kdr"},
+                "total_distance": {"$toDouble": "$total_distance"},
+                "personal_best_distance": {"$toDouble": {"$ifNull": ["$personal_best_distance", 0]}},
+                "favorite_weapon": {"$toString": {"$ifNull": ["$favorite_weapon", "Unknown"]}}
+            }}
+        ])
+        async for stats in cursor:
+            return stats
+        return None
+
+    async def get_pvp_totals(self, guild_id: int, player_names: List[str]) -> Dict[str, Any]:
+        """Sum PvP statistics (and their KDR) for several players across every server in one aggregation"""
+        totals = {
+            "kills": 0,
+            "deaths": 0,
+            "suicides": 0,
+            "total_distance": 0.0,
+            "longest_streak": 0,
+            "kdr": 0.0,
+            "player_count": 0
+        }
+        if not player_names:
+            return totals
+
+        cursor = self.pvp_data.aggregate([
+            {"$match": {"guild_id": guild_id, "player_name": {"$in": list(set(player_names))}}},
+            {"$group": {
+                "_id": None,
+                "kills": {"$sum": "$kills"},
+                "deaths": {"$sum": "$deaths"},
+                "suicides": {"$sum": "$suicides"},
+                "total_distance": {"$sum": "$total_distance"},
+                "longest_streak": {"$max": "$longest_streak"},
+                "players": {"$addToSet": "$player_name"}
+            }},
+            _KDR_STAGE
+        ])
+        async for group in cursor:
+            for field in ("kills", "deaths", "suicides", "total_distance", "kdr"):
+                totals[field] = group.get(field) or totals[field]
+            totals["longest_streak"] = group.get("longest_streak") or 0
+            totals["player_count"] = len(group.get("players", []))
+        return totals
+
+    async def get_linked_totals(self, guild_id: int, discord_ids: List[int]) -> Dict[str, Any]:
+        """
+        Sum kills/deaths over every character linked to the given Discord users,
+        resolving the links with a $lookup so the whole thing is one round trip
+        """
+        totals = {"kills": 0, "deaths": 0, "kdr": 0.0, "player_count": 0}
+        if not discord_ids:
+            return totals
+
+        cursor = self.players.aggregate([
+            {"$match": {"guild_id": guild_id, "discord_id": {"$in": list(set(discord_ids))}}},
+            {"$unwind": "$linked_characters"},
+            {"$group": {"_id": "$linked_characters"}},
+            {"$lookup": {
+                "from": self.pvp_data.name,
+                "let": {"player_name": "$_id"},
+                "pipeline": [
+                    {"$match": {"$expr": {"$and": [
+                        {"$eq": ["$guild_id", guild_id]},
+                        {"$eq": ["$player_name", "$$player_name"]}
+                    ]}}},
+                    {"$project": {"kills": 1, "deaths": 1}}
+                ],
+                "as": "pvp"
+            }},
+            {"$unwind": "$pvp"},
+            {"$group": {
+                "_id": None,
+                "kills": {"$sum": "$pvp.kills"},
+                "deaths": {"$sum": "$pvp.deaths"},
+                "players": {"$addToSet": "$_id"}
+            }},
+            _KDR_STAGE
+        ])
+        async for group in cursor:
+            for field in ("kills", "deaths", "kdr"):
+                totals[field] = group.get(field) or totals[field]
+            totals["player_count"] = len(group.get("players", []))
+        return totals
+
+    async def get_player_factions(self, guild_id: int, player_names: List[str]) -> Dict[str, str]:
+        """
+        Map each character name to its owner's faction tag (or name), resolving
+        links and factions for the whole list in one aggregation
+        """
+        names = list({name for name in player_names if name})
+        if not names:
+            return {}
+
+        cursor = self.players.aggregate([
+            {"$match": {"guild_id": guild_id, "linked_characters": {"$in": names}}},
+            {"$unwind": "$linked_characters"},
+            {"$match": {"linked_characters": {"$in": names}}},
+            {"$lookup": {
+                "from": self.factions.name,
+                "let": {"discord_id": "$discord_id"},
+                "pipeline": [
+                    {"$match": {"$expr": {"$and": [
+                        {"$eq": ["$guild_id", guild_id]},
+                        {"$in": ["$$discord_id", {"$ifNull": ["$members", []]}]}
+                    ]}}},
+                    {"$project": {"faction_tag": 1, "faction_name": 1}},
+                    {"$limit": 1}
+                ],
+                "as": "faction"
+            }},
+            {"$unwind": "$faction"},
+            {"$project": {
+                "_id": 0,
+                "player_name": "$linked_characters",
+                "faction": {"$cond": [
+                    {"$gt": [{"$strLenCP": {"$ifNull": ["$faction.faction_tag", ""]}}, 0]},
+                    "$faction.faction_tag",
+                    "$faction.faction_name"
+                ]}
+            }}
+        ])
+        return {doc["player_name"]: doc["faction"] async for doc in cursor if doc.get("faction")}
+
     async def get_guild_currency_name(self, guild_id: int) -> str:
         """Get custom currency name for guild or default"""
         try:
@@ -868,40 +1103,45 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Failed to reset player streak: {e}")
 
-    async def add_kill_event(self, guild_id: int, server_id: str, kill_data: Dict[str, Any]):
-        """Add a kill event to the database with enhanced distance validation"""
-        try:
-            # PHASE 1 FIX: Ensure distance is properly validated before DB insertion
-            distance = kill_data.get("distance", 0)
-            if isinstance(distance, str):
-                try:
-                    distance = float(distance) if distance else 0.0
-                except (ValueError, TypeError):
-                    distance = 0.0
-            elif not isinstance(distance, (int, float)):
+    def _build_kill_event_doc(self, guild_id: int, server_id: str, kill_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a kill_events document with enhanced distance validation"""
+        # PHASE 1 FIX: Ensure distance is properly validated before DB insertion
+        distance = kill_data.get("distance", 0)
+        if isinstance(distance, str):
+            try:
+                distance = float(distance) if distance else 0.0
+            except (ValueError, TypeError):
                 distance = 0.0
+        elif not isinstance(distance, (int, float)):
+            distance = 0.0
 
-            # Ensure distance is within reasonable bounds
-            distance = max(0.0, min(distance, 5000.0))
+        # Ensure distance is within reasonable bounds
+        distance = max(0.0, min(distance, 5000.0))
 
-            kill_event = {
-                "guild_id": guild_id,
-                "server_id": server_id,
-                "timestamp": kill_data.get("timestamp", datetime.now(timezone.utc)),
-                "killer": kill_data.get("killer", ""),
-                "killer_id": kill_data.get("killer_id", ""),
-                "victim": kill_data.get("victim", ""),
-                "victim_id": kill_data.get("victim_id", ""),
-                "weapon": kill_data.get("weapon", ""),
-                "distance": distance,  # Now properly validated numeric value
-                "killer_platform": kill_data.get("killer_platform", ""),
-                "victim_platform": kill_data.get("victim_platform", ""),
-                "is_suicide": kill_data.get("is_suicide", False),
-                "raw_line": kill_data.get("raw_line", "")
-            }
+        return {
+            "guild_id": guild_id,
+            "server_id": server_id,
+            "timestamp": kill_data.get("timestamp", datetime.now(timezone.utc)),
+            "killer": kill_data.get("killer", ""),
+            "killer_id": kill_data.get("killer_id", ""),
+            "victim": kill_data.get("victim", ""),
+            "victim_id": kill_data.get("victim_id", ""),
+            "weapon": kill_data.get("weapon", ""),
+            "distance": distance,  # Now properly validated numeric value
+            "killer_platform": kill_data.get("killer_platform", ""),
+            "victim_platform": kill_data.get("victim_platform", ""),
+            "is_suicide": kill_data.get("is_suicide", False),
+            "raw_line": kill_data.get("raw_line", "")
+        }
+
+    async def add_kill_event(self, guild_id: int, server_id: str, kill_data: Dict[str, Any]):
+        """Add a kill event to the database with enhanced distance validation"""
+        try:
+            kill_event = self._build_kill_event_doc(guild_id, server_id, kill_data)
+            distance = kill_event["distance"]
 
             await self.kill_events.insert_one(kill_event)
-            logger.debug(f"Added kill event: {kill_data['killer']} -> {kill_data['victim']} (distance: {distance}m)")
+            logger.debug("Added kill event: %s -> %s (distance: %sm)", kill_data['killer'], kill_data['victim'], distance)
             
             # Update player stats for killer (if not suicide)
             if not kill_data.get('is_suicide', False):
@@ -923,6 +1163,128 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Failed to add kill event: {e}")
 
+    async def add_kill_events_bulk(self, guild_id: int, server_id: str, kill_events: List[Dict[str, Any]]) -> int:
+        """
+        Add a chronologically ordered batch of kill events in three round trips:
+        one insert_many, one stats lookup for every player involved, and one
+        bulk_write of per-player deltas. Returns the number of events stored.
+
+        Streaks and KDR are applied server-side in update pipelines, so a
+        concurrent writer for the same server can't be overwritten by values
+        computed from the lookup snapshot.
+        """
+        if not kill_events:
+            return 0
+
+        docs = [self._build_kill_event_doc(guild_id, server_id, kill_data) for kill_data in kill_events]
+        await self.kill_events.insert_many(docs, ordered=False)
+
+        # (killer, victim) pairs with names normalised the same way as update_pvp_stats
+        pairs = [((doc["killer"] or "").strip(), (doc["victim"] or "").strip()) for doc in docs]
+        player_names = {victim for _, victim in pairs}
+        player_names.update(killer for (killer, _), doc in zip(pairs, docs) if not doc["is_suicide"])
+        player_names.discard("")
+
+        current = {}
+        cursor = self.pvp_data.find(
+            {"guild_id": guild_id, "server_id": server_id, "player_name": {"$in": list(player_names)}},
+            {"player_name": 1, "last_kill_timestamp": 1}
+        )
+        async for stats in cursor:
+            current[stats["player_name"]] = stats
+
+        # Replay the batch in order so streaks match per-event processing
+        deltas: Dict[str, Dict[str, Any]] = {}
+        for (killer, victim), doc in zip(pairs, docs):
+
+            if not doc["is_suicide"] and killer:
+                delta = deltas.get(killer)
+                if delta is None:
+                    delta = deltas[killer] = self._new_stats_delta(current.get(killer, {}))
+
+                # Chronological validation: skip kills older than the last one recorded
+                last_kill = delta["last_kill_timestamp"]
+                event_time = doc["timestamp"]
+                try:
+                    out_of_order = isinstance(last_kill, datetime) and event_time < last_kill
+                except TypeError:
+                    out_of_order = False
+
+                if not out_of_order:
+                    delta["kills"] += 1
+                    delta["total_distance"] += round(doc["distance"], 1)
+                    delta["run"] += 1
+                    if not delta["reset"]:
+                        delta["lead_kills"] += 1
+                    delta["best_run"] = max(delta["best_run"], delta["run"])
+                    delta["personal_best_distance"] = max(delta["personal_best_distance"], round(doc["distance"], 1))
+                    delta["last_kill_timestamp"] = event_time
+
+            if victim:
+                delta = deltas.get(victim)
+                if delta is None:
+                    delta = deltas[victim] = self._new_stats_delta(current.get(victim, {}))
+                delta["deaths"] += 1
+                delta["reset"] = True
+                delta["run"] = 0
+
+        operations = []
+        for player_name, delta in deltas.items():
+            # Kills before the batch's first death extend the stored streak; after a
+            # death the streak restarts from the batch's trailing run
+            extended_streak = {"$add": [{"$ifNull": ["$current_streak", 0]}, delta["lead_kills"]]}
+            counters = {
+                "kills": {"$add": [{"$ifNull": ["$kills", 0]}, delta["kills"]]},
+                "deaths": {"$add": [{"$ifNull": ["$deaths", 0]}, delta["deaths"]]},
+                "total_distance": {"$add": [{"$ifNull": ["$total_distance", 0.0]}, delta["total_distance"]]},
+                "current_streak": delta["run"] if delta["reset"] else extended_streak,
+                "longest_streak": {"$max": [{"$ifNull": ["$longest_streak", 0]}, extended_streak, delta["best_run"]]},
+                "personal_best_distance": {"$max": [
+                    {"$ifNull": ["$personal_best_distance", 0.0]}, delta["personal_best_distance"]
+                ]},
+                "created_at": {"$ifNull": ["$created_at", "$$NOW"]},
+                "favorite_weapon": {"$ifNull": ["$favorite_weapon", None]},
+                "best_streak": {"$ifNull": ["$best_streak", 0]},
+                "last_updated": "$$NOW"
+            }
+            if isinstance(delta["last_kill_timestamp"], datetime):
+                counters["last_kill_timestamp"] = {"$max": ["$last_kill_timestamp", delta["last_kill_timestamp"]]}
+
+            operations.append(UpdateOne(
+                {"guild_id": guild_id, "server_id": server_id, "player_name": player_name},
+                [
+                    {"$set": counters},
+                    {"$set": {"kdr": {"$cond": [
+                        {"$gt": ["$deaths", 0]},
+                        {"$divide": ["$kills", "$deaths"]},
+                        {"$toDouble": "$kills"}
+                    ]}}}
+                ],
+                upsert=True
+            ))
+            self.player_stats_cache.invalidate((guild_id, player_name))
+
+        if operations:
+            await self.pvp_data.bulk_write(operations, ordered=False)
+
+        logger.debug(f"Bulk added {len(docs)} kill events for {len(operations)} players on server {server_id}")
+        return len(docs)
+
+    @staticmethod
+    def _new_stats_delta(stored: Dict[str, Any]) -> Dict[str, Any]:
+        """Starting point for accumulating one player's changes across a batch"""
+        return {
+            "kills": 0,
+            "deaths": 0,
+            "total_distance": 0.0,
+            "reset": False,       # a death was recorded in this batch
+            "lead_kills": 0,      # kills before the batch's first death
+            "run": 0,             # kills since the batch's last death
+            "best_run": 0,        # longest run of kills inside the batch
+            "personal_best_distance": 0.0,
+            "last_kill_timestamp": stored.get("last_kill_timestamp")
+        }
+
     async def increment_player_kill(self, guild_id: int, server_id: str, player_name: str, distance: float = 0.0, event_timestamp: Optional[datetime] = None):
         """Increment player kill count and update streak/distance stats with chronological validation"""
         try:
@@ -945,53 +1307,10 @@ class DatabaseManager:
             distance = max(0.0, min(float(distance), 5000.0))  # Validate range
             distance = round(distance, 1)  # Round for consistency
 
-            # Chronological validation: Check if this event is newer than last processed
-            if event_timestamp:
-                try:
-                    current_stats = await self.get_pvp_stats(guild_id, server_id, player_name)
-                    if current_stats and current_stats.get('last_kill_timestamp'):
-                        last_timestamp = current_stats['last_kill_timestamp']
-                        if isinstance(last_timestamp, datetime) and event_timestamp < last_timestamp:
-                            logger.debug(f"Skipping out-of-order kill event for {player_name}: {event_timestamp} < {last_timestamp}")
-                            return
-                except Exception as timestamp_error:
-                    logger.debug(f"Timestamp validation failed, proceeding: {timestamp_error}")
-
-            # Get current stats to calculate new longest distance and streak
-            current_stats = await self.get_pvp_stats(guild_id, server_id, player_name)
-
-            # Calculate new streak and longest distance
-            current_streak = current_stats.get('current_streak', 0) if current_stats else 0
-            new_streak = current_streak + 1
-            longest_streak = max(current_stats.get('longest_streak', 0) if current_stats else 0, new_streak)
-            personal_best_distance = max(current_stats.get('personal_best_distance', 0.0) if current_stats else 0.0, distance)
-
-            # Use atomic increment for kills
-            await self.update_pvp_stats(guild_id, server_id, player_name, {"kills": 1})
-
-            # Add distance to total_distance (accumulated) if distance > 0
-            if distance > 0:
-                # Use atomic increment to accumulate total distance
-                current_total = current_stats.get('total_distance', 0.0) if current_stats else 0.0
-                new_total = current_total + distance
-                await self.update_pvp_stats(guild_id, server_id, player_name, {"total_distance": new_total})
-
-            # Update streak, personal best, and timestamp in single operation
-            update_data = {
-                "current_streak": new_streak,
-                "longest_streak": longest_streak
-            }
-
-            # Only update personal best if this distance is actually better
-            current_best = current_stats.get('personal_best_distance', 0.0) if current_stats else 0.0
-            if distance > 0 and distance > current_best:
-                update_data["personal_best_distance"] = distance
-
-            # Update last kill timestamp for chronological tracking
-            if event_timestamp:
-                update_data["last_kill_timestamp"] = event_timestamp
-
-            await self.update_pvp_stats(guild_id, server_id, player_name, update_data)
+            await self.increment_player_stats(
+                guild_id, server_id, player_name,
+                kills=1, distance=distance, event_timestamp=event_timestamp
+            )
 
         except Exception as e:
             logger.error(f"Failed to increment player kill: {e}")
@@ -999,16 +1318,70 @@ class DatabaseManager:
     async def increment_player_death(self, guild_id: int, server_id: str, player_name: str):
         """Increment player death count and reset streak"""
         try:
-            await self.update_pvp_stats(
-                guild_id, server_id, player_name,
-                {"deaths": 1}
-            )
-            # Reset streak separately
-            await self.reset_player_streak(guild_id, server_id, player_name)
+            await self.increment_player_stats(guild_id, server_id, player_name, deaths=1)
 
         except Exception as e:
             logger.error(f"Failed to increment player death: {e}")
 
+    async def increment_player_stats(self, guild_id: int, server_id: str, player_name: str,
+                                     kills: int = 0, deaths: int = 0, suicides: int = 0,
+                                     distance: float = 0.0,
+                                     event_timestamp: Optional[datetime] = None) -> bool:
+        """
+        Apply kill/death deltas to a player's PvP stats in one atomic upsert.
+
+        All arithmetic (streaks, personal best, KDR and the out-of-order kill
+        check) runs server-side in an update pipeline, so concurrent events for
+        the same player can't overwrite each other.
+        """
+        player_name = str(player_name).strip()
+        if not player_name:
+            logger.debug("Skipping stats update for empty player name")
+            return False
+
+        # Kills older than the last recorded one are ignored (chronological validation)
+        if kills and event_timestamp:
+            skip_kill = {"$gt": ["$last_kill_timestamp", event_timestamp]}
+        else:
+            skip_kill = False
+        kill_inc = {"$cond": ["$_skip_kill", 0, kills]}
+        distance_inc = {"$cond": ["$_skip_kill", 0.0, distance]}
+
+        counters = {
+            "kills": {"$add": [{"$ifNull": ["$kills", 0]}, kill_inc]},
+            "deaths": {"$add": [{"$ifNull": ["$deaths", 0]}, deaths]},
+            "suicides": {"$add": [{"$ifNull": ["$suicides", 0]}, suicides]},
+            "total_distance": {"$add": [{"$ifNull": ["$total_distance", 0.0]}, distance_inc]},
+            "current_streak": 0 if deaths else {"$add": [{"$ifNull": ["$current_streak", 0]}, kill_inc]},
+            "personal_best_distance": {"$max": [{"$ifNull": ["$personal_best_distance", 0.0]}, distance_inc]},
+            "created_at": {"$ifNull": ["$created_at", "$$NOW"]},
+            "favorite_weapon": {"$ifNull": ["$favorite_weapon", None]},
+            "best_streak": {"$ifNull": ["$best_streak", 0]},
+            "last_updated": "$$NOW"
+        }
+        if kills and event_timestamp:
+            counters["last_kill_timestamp"] = {"$cond": ["$_skip_kill", "$last_kill_timestamp", event_timestamp]}
+
+        result = await self.pvp_data.update_one(
+            {"guild_id": guild_id, "server_id": server_id, "player_name": player_name},
+            [
+                {"$set": {"_skip_kill": skip_kill}},
+                {"$set": counters},
+                {"$set": {
+                    "longest_streak": {"$max": [{"$ifNull": ["$longest_streak", 0]}, "$current_streak"]},
+                    "kdr": {"$cond": [
+                        {"$gt": ["$deaths", 0]},
+                        {"$divide": ["$kills", "$deaths"]},
+                        {"$toDouble": "$kills"}
+                    ]}
+                }},
+                {"$unset": "_skip_kill"}
+            ],
+            upsert=True
+        )
+        self.player_stats_cache.invalidate((guild_id, player_name))
+        return result.acknowledged
+
     async def find_player_by_character_name(self, guild_id: int, character_name: str) -> Optional[Dict]:
         """Find a player document by searching linked character names (case-insensitive, space-normalized)"""
         try:
@@ -1163,9 +1536,11 @@ class DatabaseManager:
             return state_changed
             
         except Exception as e:
-            logger.error(f"Failed to update player state for {player_id[:8]}...: {e}")
-            import traceback
-            logger.error(f"Stack trace: {traceback.format_exc()}")
+            # Called per player event, so a database outage is logged at most once a second per guild
+            allowed, suppressed = self._error_log_throttle.allow(guild_id)
+            if allowed:
+                logger.error(f"Failed to update player state for {player_id[:8]}... "
+                             f"({suppressed} similar errors suppressed): {e}", exc_info=True)
             return False
 
     async def get_active_player_count(self, guild_id: int, server_name: str) -> int:
@@ -1245,18 +1620,6 @@ class DatabaseManager:
             logger.error(f"Failed to check premium status: {e}")
             return False
 
-    # LEADERBOARDS
-    async def get_leaderboard(self, guild_id: int, server_id: str, stat: str = "kills", 
-                             limit: int = 10) -> List[Dict[str, Any]]:
-        """Get leaderboard for specific stat"""
-        sort_order = -1 if stat in ["kills", "kdr", "longest_streak"] else 1
-
-        cursor = self.pvp_data.find(
-            {"guild_id": guild_id, "server_id": server_id}
-        ).sort(stat, sort_order).limit(limit)
-
-        return await cursor.to_list(length=limit)
-
     # LOG PARSER SUPPORT METHODS
     async def get_active_premium_servers(self) -> List[Dict[str, Any]]:
         """Get all active premium servers for log parser"""
@@ -1678,18 +2041,23 @@ class DatabaseManager:
             logger.error(f"Failed to get premium limit: {e}")
             return 0
 
+    @staticmethod
+    def _active_premium_filter(guild_id: int) -> Dict[str, Any]:
+        """Query matching a guild's active, unexpired premium servers"""
+        return {
+            "guild_id": guild_id,
+            "is_active": True,
+            "$or": [
+                {"expires_at": {"$exists": False}},
+                {"expires_at": None},
+                {"expires_at": {"$gt": datetime.now(timezone.utc)}}
+            ]
+        }
+
     async def count_premium_servers(self, guild_id: int) -> int:
         """Count active premium servers for guild"""
         try:
-            count = await self.server_premium_status.count_documents({
-                "guild_id": guild_id,
-                "is_active": True,
-                "$or": [
-                    {"expires_at": {"$exists": False}},
-                    {"expires_at": None},
-                    {"expires_at": {"$gt": datetime.now(timezone.utc)}}
-                ]
-            })
+            count = await self.server_premium_status.count_documents(self._active_premium_filter(guild_id))
             return count
         except Exception as e:
             logger.error(f"Failed to count premium servers: {e}")
@@ -1711,6 +2079,7 @@ class DatabaseManager:
                 },
                 upsert=True
             )
+            self.premium_access_cache.invalidate(guild_id)
             return True
         except Exception as e:
             logger.error(f"Failed to activate server premium: {e}")
@@ -1730,6 +2099,7 @@ class DatabaseManager:
                     }
                 }
             )
+            self.premium_access_cache.invalidate(guild_id)
             return True
         except Exception as e:
             logger.error(f"Failed to deactivate server premium: {e}")
@@ -1754,10 +2124,13 @@ class DatabaseManager:
             return False
 
     async def has_premium_access(self, guild_id: int) -> bool:
-        """Check if guild has premium access (any server is premium)"""
+        """Check if guild has premium access (any server is premium), cached briefly"""
+        async def load() -> bool:
+            doc = await self.server_premium_status.find_one(self._active_premium_filter(guild_id), {"_id": 1})
+            return doc is not None
+
         try:
-            count = await self.count_premium_servers(guild_id)
-            return count > 0
+            return await self.premium_access_cache.get_or_load(guild_id, load)
         except Exception as e:
             logger.error(f"Failed to check premium access: {e}")
             return False
@@ -938,7 +938,7 @@ class HistoricalParser:
 
                 try:
                     # Parse kill event to extract timestamp
-                    kill_data = await self.killfeed_parser.parse_csv_line(line)
+                    kill_data = self.killfeed_parser.parse_csv_line(line)
                     if kill_data:
                         # Validate kill data
                         if not kill_data.get('killer') or not kill_data.get('victim'):
@@ -974,48 +974,14 @@ class HistoricalParser:
                 batch_end = min(batch_start + batch_size, len(kill_events_buffer))
                 batch = kill_events_buffer[batch_start:batch_end]
                 
-                # Process batch sequentially to maintain chronological order
-                for i, (timestamp, kill_data) in enumerate(batch):
-                    try:
-                        # Add to database without sending embeds
-                        await self.bot.db_manager.add_kill_event(guild_id, server_id, kill_data)
-
-                        # Update stats using proper MongoDB update syntax
-                        if not kill_data['is_suicide']:
-                            # Update killer stats atomically
-                            await self.bot.db_manager.pvp_data.update_one(
-                                {
-                                    "guild_id": guild_id,
-                                    "server_id": server_id,
-                                    "player_name": kill_data['killer']
-                                },
-                                {
-                                    "$inc": {"kills": 1},
-                                    "$setOnInsert": {"deaths": 0, "suicides": 0}
-                                },
-                                upsert=True
-                            )
-
-                        # Update victim stats atomically
-                        update_field = "suicides" if kill_data['is_suicide'] else "deaths"
-                        await self.bot.db_manager.pvp_data.update_one(
-                            {
-                                "guild_id": guild_id,
-                                "server_id": server_id,
-                                "player_name": kill_data['victim']
-                            },
-                            {
-                                "$inc": {update_field: 1},
-                                "$setOnInsert": {"kills": 0}
-                            },
-                            upsert=True
-                        )
-
-                        processed_count += 1
-
-                    except Exception as e:
-                        logger.warning(f"Error processing chronological event {batch_start + i}: {e}")
-                        continue
+                # One bulk insert plus one bulk stats update per batch; events are
+                # replayed in order inside add_kill_events_bulk so streaks stay chronological
+                try:
+                    processed_count += await self.bot.db_manager.add_kill_events_bulk(
+                        guild_id, server_id, [kill_data for _, kill_data in batch]
+                    )
+                except Exception as e:
+                    logger.warning(f"Error processing chronological events {batch_start}-{batch_end - 1}: {e}")
 
                 # Batch-level progress tracking
                 batches_processed += 1
@@ -35,19 +35,12 @@ class KillfeedParser:
     def parse_csv_line(self, line: str) -> Dict[str, Any]:
         """Parse a single CSV line into kill event data"""
         try:
-            parts = line.strip().split(';')
+            parts = line.split(';')
             if len(parts) < 7:
                 return {}
-            timestamp_str = parts[0].strip()
-            killer = parts[1].strip()
-            killer_id = parts[2].strip()
-            victim = parts[3].strip()
-            victim_id = parts[4].strip()
-            weapon = parts[5].strip()
-            distance = parts[6].strip() if len(parts) > 6 else '0'
-
-            killer = killer.strip()
-            victim = victim.strip()
+            timestamp_str, killer, killer_id, victim, victim_id, weapon, distance = (
+                part.strip() for part in parts[:7]
+            )
 
             # Parse timestamp - handle multiple formats
             try:
@@ -61,11 +54,12 @@ class KillfeedParser:
                     timestamp = datetime.utcnow().replace(tzinfo=timezone.utc)
 
             # Normalize suicide events
-            is_suicide = killer == victim or weapon.lower() == 'suicide_by_relocation'
+            weapon_lower = weapon.lower()
+            is_suicide = killer == victim or weapon_lower == 'suicide_by_relocation'
             if is_suicide:
-                if weapon.lower() == 'suicide_by_relocation':
+                if weapon_lower == 'suicide_by_relocation':
                     weapon = 'Menu Suicide'
-                elif weapon.lower() == 'falling':
+                elif weapon_lower == 'falling':
                     weapon = 'Falling'
                     is_suicide = True
                 else:
@@ -73,10 +67,7 @@ class KillfeedParser:
 
             # Parse distance
             try:
-                if distance and distance != '':
-                    distance_float = float(distance)
-                else:
-                    distance_float = 0.0
+                distance_float = float(distance) if distance else 0.0
             except ValueError:
                 distance_float = 0.0
 
@@ -247,14 +238,13 @@ class KillfeedParser:
             logger.error(f"Error getting newest CSV file: {e}")
             return None
 
-    async def process_kill_event(self, guild_id: int, server_id: str, kill_data: Dict[str, Any]):
-        """Process a kill event and update database"""
+    async def process_kill_events(self, guild_id: int, server_id: str, kill_events: List[Dict[str, Any]]):
+        """Store a batch of kill events with bulk database writes"""
         try:
-            # Update database with kill event
-            await self.bot.db_manager.add_kill_event(guild_id, server_id, kill_data)
+            await self.bot.db_manager.add_kill_events_bulk(guild_id, server_id, kill_events)
 
         except Exception as e:
-            logger.error(f"Error processing kill event: {e}")
+            logger.error(f"Error processing kill events: {e}")
 
     async def send_killfeed_embed(self, guild_id: int, server_id: str, kill_data: Dict[str, Any]):
         """Send killfeed embed to designated channel"""
@@ -291,11 +281,13 @@ class KillfeedParser:
                     
                     if remaining_lines:
                         logger.info(f"📋 Processing {len(remaining_lines)} final lines from old file")
+                        kill_events = []
                         for line in remaining_lines:
                             if line.strip():
                                 kill_data = self.parse_csv_line(line)
                                 if kill_data:
-                                    await self.process_kill_event(guild_id, server_config['server_id'], kill_data)
+                                    kill_events.append(kill_data)
+                        await self.process_kill_events(guild_id, server_config['server_id'], kill_events)
         except Exception as e:
             logger.error(f"Error processing final lines: {e}")
 
@@ -345,16 +337,19 @@ class KillfeedParser:
                         new_lines = lines[last_line_count:]
                         logger.info(f"📊 Processing {len(new_lines)} new lines (total: {len(lines)}, last processed: {last_line_count})")
                         
-                        kill_count = 0
+                        kill_events = []
                         for line in new_lines:
                             if line.strip():
                                 kill_data = self.parse_csv_line(line)
                                 if kill_data:
-                                    kill_count += 1
-                                    await self.process_kill_event(guild_id, server_id, kill_data)
-                                    await self.send_killfeed_embed(guild_id, server_id, kill_data)
+                                    kill_events.append(kill_data)
+
+                        # Store the whole batch first, then deliver embeds in order
+                        await self.process_kill_events(guild_id, server_id, kill_events)
+                        for kill_data in kill_events:
+                            await self.send_killfeed_embed(guild_id, server_id, kill_data)
                         
-                        logger.info(f"🎯 Processed {kill_count} kill events from {newest_file}")
+                        logger.info(f"🎯 Processed {len(kill_events)} kill events from {newest_file}")
                         
                         # Update last processed line count
                         self.last_processed_lines[server_key] = len(lines)
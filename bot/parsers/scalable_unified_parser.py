@@ -6,7 +6,8 @@ Enterprise-grade unified log processing with Deadside.log focus, file rotation d
 import asyncio
 import logging
 import discord
-from datetime import datetime, timezone
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any
 from bot.utils.scalable_unified_processor import ScalableUnifiedProcessor
 from bot.utils.shared_parser_state import get_shared_state_manager
@@ -94,9 +95,7 @@ class ScalableUnifiedParser:
             logger.info(f"✅ Scalable unified parser completed processing for {len(guild_configs)} guilds")
             
         except Exception as e:
-            logger.error(f"❌ Scalable unified parser error: {e}")
-            import traceback
-            logger.error(f"Parser traceback: {traceback.format_exc()}")
+            logger.error(f"❌ Scalable unified parser error: {e}", exc_info=True)
     
 
     
@@ -419,7 +418,7 @@ class ScalableUnifiedParser:
                     # Initialize tracking for new servers
                     if server_id not in self.activity_tracker:
                         self.activity_tracker[server_id] = {
-                            'recent_activity': [],
+                            'recent_activity': deque(maxlen=20),  # Last 20 sessions (~1 hour)
                             'avg_kills_per_hour': 0,
                             'last_active': None,
                             'activity_level': 'idle'  # idle, moderate, active, high
@@ -431,10 +430,6 @@ class ScalableUnifiedParser:
                         'kills_processed': processed_kills
                     })
                     
-                    # Keep only last 20 sessions for analysis (last hour of data)
-                    self.activity_tracker[server_id]['recent_activity'] = \
-                        self.activity_tracker[server_id]['recent_activity'][-20:]
-                    
                     # Update activity metrics
                     if processed_kills > 0:
                         self.activity_tracker[server_id]['last_active'] = current_time
@@ -458,18 +453,16 @@ class ScalableUnifiedParser:
                 tracker['avg_kills_per_hour'] = 0
                 return
             
-            # Calculate kills per hour over recent sessions
-            current_time = datetime.now(timezone.utc)
-            one_hour_ago = current_time.replace(hour=current_time.hour-1) if current_time.hour > 0 else current_time.replace(day=current_time.day-1, hour=23)
+            # Sessions are appended in time order, so dropping stale ones from the head
+            # leaves exactly the last hour of data
+            one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
+            while recent_sessions and recent_sessions[0]['timestamp'] < one_hour_ago:
+                recent_sessions.popleft()
             
-            recent_kills = sum(
-                session['kills_processed'] 
-                for session in recent_sessions 
-                if session['timestamp'] >= one_hour_ago
-            )
+            recent_kills = sum(session['kills_processed'] for session in recent_sessions)
             
             # Estimate kills per hour (3-minute intervals = 20 sessions per hour)
-            sessions_in_hour = len([s for s in recent_sessions if s['timestamp'] >= one_hour_ago])
+            sessions_in_hour = len(recent_sessions)
             if sessions_in_hour > 0:
                 estimated_kills_per_hour = (recent_kills / sessions_in_hour) * 20
             else:
@@ -546,9 +546,7 @@ class UnifiedLogParser:
                 logger.warning(f"❌ No guild config found for guild {guild_id}")
                         
         except Exception as e:
-            logger.error(f"Voice channel update failed: {e}")
-            import traceback
-            logger.error(f"Voice channel traceback: {traceback.format_exc()}")
+            logger.error(f"Voice channel update failed: {e}", exc_info=True)
             
     async def get_parser_state(self, guild_id: int, server_id: str) -> Dict[str, Any]:
         """Get parser state from database"""
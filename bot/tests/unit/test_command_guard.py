@@ -0,0 +1,59 @@
+"""
+Unit Tests for the Command Guard Decorator
+"""
+
+import asyncio
+import discord
+
+from bot.utils.command_guard import safe_command
+
+_ERROR_EMBED = discord.Embed(title="❌ Error")
+_DB_ERROR_EMBED = discord.Embed(title="❌ Database Error")
+
+class _Cog:
+    def __init__(self, bot=None):
+        self.bot = bot
+
+    @safe_command(_ERROR_EMBED)
+    async def ok(self, ctx):
+        return "done"
+
+    @safe_command(_ERROR_EMBED, ephemeral=True)
+    async def broken(self, ctx):
+        raise RuntimeError("boom")
+
+    @safe_command(_ERROR_EMBED)
+    async def broken_public(self, ctx):
+        raise RuntimeError("boom")
+
+    @safe_command(_ERROR_EMBED, db_error_embed=_DB_ERROR_EMBED)
+    async def needs_db(self, ctx):
+        return "done"
+
+class TestSafeCommand:
+    """Test the shared defer and error handling"""
+
+    def test_defers_and_returns_result(self, mock_ctx):
+        """The command runs after a public defer"""
+        assert asyncio.run(_Cog().ok(mock_ctx)) == "done"
+        mock_ctx.defer.assert_awaited_once_with(ephemeral=False)
+        mock_ctx.followup.send.assert_not_awaited()
+
+    def test_errors_send_error_embed(self, mock_ctx):
+        """Uncaught errors become an ephemeral error followup"""
+        asyncio.run(_Cog().broken(mock_ctx))
+        mock_ctx.defer.assert_awaited_once_with(ephemeral=True)
+        mock_ctx.followup.send.assert_awaited_once_with(embed=_ERROR_EMBED, ephemeral=True)
+
+    def test_public_errors_match_the_defer(self, mock_ctx):
+        """After a public defer the error followup is sent with matching visibility"""
+        asyncio.run(_Cog().broken_public(mock_ctx))
+        mock_ctx.defer.assert_awaited_once_with(ephemeral=False)
+        mock_ctx.followup.send.assert_awaited_once_with(embed=_ERROR_EMBED, ephemeral=False)
+
+    def test_missing_db_responds_without_deferring(self, mock_bot, mock_ctx):
+        """A missing database manager is answered with the initial response"""
+        mock_bot.db_manager = None
+        assert asyncio.run(_Cog(mock_bot).needs_db(mock_ctx)) is None
+        mock_ctx.defer.assert_not_awaited()
+        mock_ctx.respond.assert_awaited_once_with(embed=_DB_ERROR_EMBED, ephemeral=True)
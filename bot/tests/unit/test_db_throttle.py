@@ -0,0 +1,41 @@
+"""
+Unit Tests for Database Call Throttling
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from pymongo.errors import AutoReconnect, OperationFailure
+
+from bot.utils.db_throttle import AsyncRateLimiter, run_db
+
+class TestRunDb:
+    """Test throttled database calls"""
+
+    def _prepare(self, bot):
+        bot.db_sem = asyncio.Semaphore(2)
+        bot.db_rate_limiter = AsyncRateLimiter(rps=1000)
+
+    def test_retries_transient_errors(self, mock_bot):
+        """Transient failures are retried until the call succeeds"""
+        self._prepare(mock_bot)
+        operation = AsyncMock(side_effect=[AutoReconnect("lost"), "ok"])
+        result = asyncio.run(run_db(mock_bot, operation, 1, base_delay=0))
+        assert result == "ok"
+        assert operation.await_count == 2
+
+    def test_does_not_retry_other_errors(self, mock_bot):
+        """Non-transient failures propagate immediately"""
+        self._prepare(mock_bot)
+        operation = AsyncMock(side_effect=OperationFailure("bad query"))
+        with pytest.raises(OperationFailure):
+            asyncio.run(run_db(mock_bot, operation, base_delay=0))
+        assert operation.await_count == 1
+
+    def test_no_retries_for_non_idempotent_calls(self, mock_bot):
+        """retries=0 surfaces the first transient failure instead of replaying the call"""
+        self._prepare(mock_bot)
+        operation = AsyncMock(side_effect=[AutoReconnect("lost"), "ok"])
+        with pytest.raises(AutoReconnect):
+            asyncio.run(run_db(mock_bot, operation, retries=0, base_delay=0))
+        assert operation.await_count == 1
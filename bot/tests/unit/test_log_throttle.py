@@ -0,0 +1,28 @@
+"""
+Unit Tests for Log Throttling
+"""
+
+from unittest.mock import patch
+
+from bot.utils.log_throttle import LogThrottle
+
+class TestLogThrottle:
+    """Test per-key log rate limiting"""
+
+    def test_suppresses_bursts_per_key(self):
+        """Only the first call per key passes until a token refills"""
+        throttle = LogThrottle(rate=1.0)
+        with patch("bot.utils.log_throttle.time.monotonic", return_value=100.0):
+            assert throttle.allow(1) == (True, 0)
+            assert throttle.allow(1) == (False, 1)
+            assert throttle.allow(1) == (False, 2)
+            assert throttle.allow(2) == (True, 0)
+
+    def test_reports_suppressed_count_after_refill(self):
+        """The next allowed call reports how many were dropped"""
+        throttle = LogThrottle(rate=1.0)
+        with patch("bot.utils.log_throttle.time.monotonic", side_effect=[0.0, 0.1, 0.2, 1.5]):
+            throttle.allow("guild")
+            throttle.allow("guild")
+            throttle.allow("guild")
+            assert throttle.allow("guild") == (True, 2)
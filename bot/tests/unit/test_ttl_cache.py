@@ -0,0 +1,47 @@
+"""
+Unit Tests for the Async TTL Cache
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from bot.utils.ttl_cache import AsyncTTLCache
+
+class TestAsyncTTLCache:
+    """Test cache loading and invalidation"""
+
+    def test_concurrent_misses_share_one_load(self):
+        """Concurrent misses for one key call the loader once"""
+        cache = AsyncTTLCache(maxsize=10, ttl=60)
+        loader = AsyncMock(return_value={"primary_character": "Alpha"})
+
+        async def run():
+            return await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(5)))
+
+        results = asyncio.run(run())
+        assert all(r == {"primary_character": "Alpha"} for r in results)
+        assert loader.await_count == 1
+
+    def test_invalidate_and_none_results(self):
+        """None is not cached by default and invalidation forces a reload"""
+        cache = AsyncTTLCache(maxsize=10, ttl=60)
+        loader = AsyncMock(side_effect=[None, "a", "b"])
+
+        async def run():
+            assert await cache.get_or_load("k", loader) is None
+            assert await cache.get_or_load("k", loader) == "a"
+            assert await cache.get_or_load("k", loader) == "a"
+            cache.invalidate("k")
+            return await cache.get_or_load("k", loader)
+
+        assert asyncio.run(run()) == "b"
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted when full"""
+        cache = AsyncTTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
@@ -9,6 +9,7 @@ from typing import Dict, List, Optional, Any, Tuple, NamedTuple
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
 import re
+from pymongo import UpdateOne
 from bot.utils.connection_pool import connection_manager
 
 logger = logging.getLogger(__name__)
@@ -357,11 +358,8 @@ class ChronologicalProcessor:
                 # Bulk insert kill events
                 await self.db_manager.kill_events.insert_many(kill_events_to_insert, ordered=True)
                 
-                # Bulk update simple statistics
-                await self._bulk_update_simple_stats(simple_stats)
-                
-                # Update streak statistics
-                await self._update_streak_stats(player_states)
+                # One upsert per player covering both counters and streaks
+                await self._bulk_update_player_stats(simple_stats, player_states)
             
             if valid_records > 0:
                 logger.info(f"Hybrid processed {valid_records} valid kill records for server {self.server_id}")
@@ -403,70 +401,48 @@ class ChronologicalProcessor:
         except Exception as e:
             logger.error(f"Failed to process streak update: {e}")
     
-    async def _bulk_update_simple_stats(self, simple_stats: Dict[str, Dict]):
-        """Efficiently update simple player statistics in bulk"""
+    async def _bulk_update_player_stats(self, simple_stats: Dict[str, Dict], player_states: Dict[str, Dict]):
+        """Write each player's counters and streak state for the batch as one upsert in one bulk_write"""
         try:
             bulk_operations = []
+            now = datetime.now(timezone.utc)
             
-            for player_name, stats in simple_stats.items():
-                filter_query = {
-                    'guild_id': self.guild_id,
-                    'server_id': self.server_id,
-                    'player_name': player_name
-                }
+            for player_name in simple_stats.keys() | player_states.keys():
+                update_ops = {'$set': {'last_updated': now}}
                 
-                update_ops = {
-                    '$inc': {
+                stats = simple_stats.get(player_name)
+                if stats:
+                    update_ops['$inc'] = {
                         'kills': stats['kills'],
                         'deaths': stats['deaths'],
                         'suicides': stats['suicides'],
                         'total_distance': stats['distance_sum']
-                    },
-                    '$set': {
-                        'last_updated': datetime.now(timezone.utc)
                     }
-                }
-                
-                from pymongo import UpdateOne
-                bulk_operations.append(
-                    UpdateOne(filter_query, update_ops, upsert=True)
-                )
-            
-            if bulk_operations:
-                result = await self.db_manager.pvp_data.bulk_write(bulk_operations, ordered=False)
-                logger.debug(f"Bulk updated {len(bulk_operations)} simple stat records")
-                
-        except Exception as e:
-            logger.error(f"Failed to bulk update simple stats: {e}")
-    
-    async def _update_streak_stats(self, player_states: Dict[str, Dict]):
-        """Update streak statistics for players"""
-        try:
-            for player_name, state in player_states.items():
-                filter_query = {
-                    'guild_id': self.guild_id,
-                    'server_id': self.server_id,
-                    'player_name': player_name
-                }
                 
-                update_ops = {
-                    '$set': {
-                        'current_streak': state['current_streak'],
-                        'last_updated': datetime.now(timezone.utc)
-                    },
-                    '$max': {
+                state = player_states.get(player_name)
+                if state:
+                    update_ops['$set']['current_streak'] = state['current_streak']
+                    update_ops['$max'] = {
                         'best_streak': state['best_streak'],
                         'personal_best_distance': state['longest_shot']
                     }
-                }
                 
-                await self.db_manager.pvp_data.update_one(filter_query, update_ops, upsert=True)
+                bulk_operations.append(UpdateOne(
+                    {
+                        'guild_id': self.guild_id,
+                        'server_id': self.server_id,
+                        'player_name': player_name
+                    },
+                    update_ops,
+                    upsert=True
+                ))
             
-            if player_states:
-                logger.debug(f"Updated streak stats for {len(player_states)} players")
+            if bulk_operations:
+                await self.db_manager.pvp_data.bulk_write(bulk_operations, ordered=False)
+                logger.debug(f"Bulk updated stats for {len(bulk_operations)} players")
                 
         except Exception as e:
-            logger.error(f"Failed to update streak stats: {e}")
+            logger.error(f"Failed to bulk update player stats: {e}")
     
     async def _clear_existing_server_data(self):
         """Clear existing PVP data and kill events for this server before historical processing"""
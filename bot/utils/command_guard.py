@@ -0,0 +1,39 @@
+"""
+Command Guard
+Shared defer + error handling for slash commands, so command bodies only
+carry their happy path
+"""
+
+import logging
+from functools import wraps
+from typing import Optional
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+def safe_command(error_embed: discord.Embed, ephemeral: bool = False,
+                 db_error_embed: Optional[discord.Embed] = None):
+    """
+    Defer the interaction before running the command and answer any uncaught
+    error with error_embed as a followup. Followups inherit the deferred
+    response's visibility, so they are ephemeral only when the command defers
+    with ephemeral=True. With db_error_embed set, a missing database manager
+    is answered directly, before deferring.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(self, ctx: discord.ApplicationContext, *args, **kwargs):
+            if db_error_embed is not None and not self.bot.db_manager:
+                logger.error("Database manager not initialized for %s", func.__name__)
+                await ctx.respond(embed=db_error_embed, ephemeral=True)
+                return
+
+            await ctx.defer(ephemeral=ephemeral)
+            try:
+                return await func(self, ctx, *args, **kwargs)
+            except Exception:
+                logger.exception("%s command error", func.__name__)
+                await ctx.followup.send(embed=error_embed, ephemeral=ephemeral)
+        return wrapper
+    return decorator
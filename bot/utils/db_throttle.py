@@ -0,0 +1,53 @@
+"""
+Database Call Throttling
+Bounds in-flight queries and smooths bursts of command traffic so the Motor
+connection pool is never exhausted
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable
+
+from pymongo.errors import ConnectionFailure, ExecutionTimeout
+
+logger = logging.getLogger(__name__)
+
+# Pool checkout timeouts, dropped connections and server-side timeouts are worth retrying
+TRANSIENT_DB_ERRORS = (ConnectionFailure, ExecutionTimeout, asyncio.TimeoutError)
+
+class AsyncRateLimiter:
+    """Spaces acquisitions at least 1/rps seconds apart"""
+
+    def __init__(self, rps: float = 50):
+        self.interval = 1.0 / rps
+        self._next_slot = 0.0
+
+    async def acquire(self):
+        """Reserve the next free slot and sleep until it arrives"""
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+async def run_db(bot, operation: Callable[..., Awaitable[Any]], *args,
+                 retries: int = 3, base_delay: float = 0.1, **kwargs) -> Any:
+    """
+    Run a database coroutine under the bot's concurrency cap and rate limiter,
+    retrying transient failures with exponential backoff
+    """
+    for attempt in range(retries + 1):
+        async with bot.db_sem:
+            await bot.db_rate_limiter.acquire()
+            try:
+                return await operation(*args, **kwargs)
+            except TRANSIENT_DB_ERRORS as e:
+                if attempt >= retries:
+                    raise
+                delay = base_delay * (2 ** attempt) * (1 + random.random())
+                logger.warning("Transient database error (%s), retrying in %.2fs", type(e).__name__, delay)
+
+        # Back off outside the semaphore so other callers can proceed
+        await asyncio.sleep(delay)
@@ -0,0 +1,35 @@
+"""
+Log Throttling
+Per-key token bucket that keeps repeated error logs from flooding the event
+loop during outages
+"""
+
+import time
+from typing import Dict, Hashable, Tuple
+
+class LogThrottle:
+    """Allows about `rate` log lines per second per key, with bursts up to `burst`"""
+
+    def __init__(self, rate: float = 1.0, burst: int = 1, max_keys: int = 10000):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets: Dict[Hashable, Tuple[float, float, int]] = {}
+
+    def allow(self, key: Hashable) -> Tuple[bool, int]:
+        """
+        Take a token for key. Returns (allowed, suppressed) where suppressed is
+        the number of calls dropped since the last allowed one.
+        """
+        now = time.monotonic()
+        if key not in self._buckets and len(self._buckets) >= self.max_keys:
+            self._buckets.clear()
+        tokens, last, suppressed = self._buckets.get(key, (float(self.burst), now, 0))
+        tokens = min(float(self.burst), tokens + (now - last) * self.rate)
+
+        if tokens >= 1.0:
+            self._buckets[key] = (tokens - 1.0, now, 0)
+            return True, suppressed
+
+        self._buckets[key] = (tokens, now, suppressed + 1)
+        return False, suppressed + 1
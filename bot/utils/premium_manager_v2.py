@@ -33,6 +33,12 @@ class PremiumManagerV2:
         except ImportError:
             self.cache = None
     
+    def _invalidate_premium_cache(self, guild_id: int):
+        """Drop the database manager's cached premium access for a guild"""
+        cache = getattr(self.db, "premium_access_cache", None)
+        if cache is not None:
+            cache.invalidate(guild_id)
+
     def get_guild_lock(self, guild_id: int) -> asyncio.Lock:
         """Get or create a lock for guild operations to prevent race conditions"""
         if guild_id not in self._locks:
@@ -284,6 +290,7 @@ class PremiumManagerV2:
                     },
                     upsert=True
                 )
+                self._invalidate_premium_cache(guild_id)
                 
                 return True, f"Server {server_id} activated as premium ({usage['used'] + 1}/{usage['limit']})"
                 
@@ -321,6 +328,7 @@ class PremiumManagerV2:
                         }
                     }
                 )
+                self._invalidate_premium_cache(guild_id)
                 
                 usage = await self.get_premium_usage(guild_id)
                 return True, f"Server {server_id} deactivated ({usage['used']}/{usage['limit']})"
@@ -34,6 +34,8 @@ class ScalableKillfeedProcessor:
         self.guild_id = guild_id
         self.server_config = server_config
         self.server_name = server_config.get('name', server_config.get('server_name', 'default'))
+        # Stats collections are keyed by the configured id, not the display name
+        self.server_id = server_config.get('server_id', server_config.get('_id', 'default'))
         self.cancelled = False
         self.state_manager = get_shared_state_manager()
     
@@ -437,6 +439,9 @@ class ScalableKillfeedProcessor:
                 logger.warning(f"Bot components not available for killfeed delivery")
                 return
             
+            # Stats for delivered events are written in one bulk call after the loop
+            kill_records = []
+
             # Process each kill event
             for event in events[:10]:  # Limit to prevent spam
                 try:
@@ -479,20 +484,26 @@ class ScalableKillfeedProcessor:
                         else:
                             logger.warning(f"Failed to send killfeed embed to channel")
                     
-                    # Record kill in database for stats
-                    if hasattr(bot, 'db_manager') and bot.db_manager:
-                        await bot.db_manager.record_kill(
-                            guild_id=self.guild_id,
-                            killer_name=event.killer,
-                            victim_name=event.victim,
-                            weapon=weapon,
-                            server_name=self.server_name,
-                            timestamp=event.timestamp,
-                            distance=event.distance
-                        )
+                    kill_records.append({
+                        'killer': event.killer,
+                        'victim': event.victim,
+                        'weapon': weapon,
+                        'distance': event.distance,
+                        'timestamp': event.timestamp,
+                        'is_suicide': is_suicide,
+                        'killer_platform': embed_data['killer_platform'],
+                        'victim_platform': embed_data['victim_platform']
+                    })
                 
                 except Exception as event_error:
                     logger.error(f"Failed to process individual kill event: {event_error}")
+
+            # Record kills in database for stats
+            if kill_records and getattr(bot, 'db_manager', None):
+                try:
+                    await bot.db_manager.add_kill_events_bulk(self.guild_id, self.server_id, kill_records)
+                except Exception as db_error:
+                    logger.error(f"Failed to record killfeed events: {db_error}")
             
         except Exception as e:
             logger.error(f"Failed to deliver killfeed events: {e}")
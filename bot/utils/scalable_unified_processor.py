@@ -10,6 +10,8 @@ import re
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
+from bot.utils.embed_factory import EmbedFactory
+
 logger = logging.getLogger(__name__)
 
 
@@ -272,7 +274,6 @@ class ScalableUnifiedProcessor:
         """Send connection embeds using themed embed factory"""
         try:
             from bot.utils.channel_router import ChannelRouter
-            from bot.utils.embed_factory import EmbedFactory
 
             channel_router = ChannelRouter(self.bot)
             processed_changes = []
@@ -332,7 +333,6 @@ class ScalableUnifiedProcessor:
 
         try:
             from bot.utils.channel_router import ChannelRouter
-            from bot.utils.embed_factory import EmbedFactory
 
             channel_router = ChannelRouter(self.bot)
 
@@ -357,7 +357,6 @@ class ScalableUnifiedProcessor:
     async def _create_themed_embed(self, event: Dict[str, Any]):
         """Create themed embed using embed factory"""
         try:
-            from bot.utils.embed_factory import EmbedFactory
             event_type = event['event']
 
             if event_type == 'mission_start':
@@ -658,7 +657,6 @@ class ScalableUnifiedProcessor:
             if not state_changes:
                 return []
 
-            from bot.utils.embed_factory import EmbedFactory
             from bot.utils.channel_router import ChannelRouter
 
             channel_router = ChannelRouter(self.bot)
@@ -725,7 +723,6 @@ class ScalableUnifiedProcessor:
             if not game_events:
                 return []
 
-            from bot.utils.embed_factory import EmbedFactory
             from bot.utils.channel_router import ChannelRouter
 
             channel_router = ChannelRouter(self.bot)
@@ -803,7 +800,6 @@ return processed_events
     async def _create_event_embed(self, event: Dict[str, Any]) -> Optional[tuple]:
         """Create professional Discord embed using embed factory"""
         try:
-            from bot.utils.embed_factory import EmbedFactory
 
             event_type = event.get('event')
 
@@ -1035,7 +1031,6 @@ return processed_events
             if not state_changes:
                 return []
 
-            from bot.utils.embed_factory import EmbedFactory
             from bot.utils.channel_router import ChannelRouter
 
             channel_router = ChannelRouter(self.bot)
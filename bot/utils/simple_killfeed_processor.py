@@ -13,10 +13,15 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
 from bot.utils.connection_pool import GlobalConnectionManager, connection_manager
+from bot.utils.embed_factory import EmbedFactory
 from bot.utils.killfeed_state_manager import killfeed_state_manager, KillfeedState
+from bot.utils.log_throttle import LogThrottle
 
 logger = logging.getLogger(__name__)
 
+# Shared across processors so one guild's failing channel logs at most once a second
+_delivery_error_throttle = LogThrottle(rate=1.0)
+
 @dataclass
 class KillfeedEvent:
     """Represents a single killfeed event"""
@@ -287,10 +292,10 @@ class SimpleKillfeedProcessor:
                 logger.info(f"Decoded {len(lines)} lines from content")
                 
                 # Show first few lines for debugging
-                if lines:
-                    logger.info("First 3 lines of CSV content:")
+                if lines and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("First 3 lines of CSV content:")
                     for i, line in enumerate(lines[:3]):
-                        logger.info(f"  Line {i+1}: '{line}'")
+                        logger.debug("  Line %d: '%s'", i + 1, line)
                 
                 # Extract timestamp from filename for state management
                 file_timestamp = self._extract_timestamp_from_filename(filename)
@@ -325,9 +330,7 @@ class SimpleKillfeedProcessor:
                     )
                 
         except Exception as e:
-            logger.error(f"Failed to process CSV file {filename}: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.error(f"Failed to process CSV file {filename}: {e}", exc_info=True)
         
         return events
     
@@ -381,7 +384,7 @@ class SimpleKillfeedProcessor:
             )
             
         except Exception as e:
-            logger.debug(f"Failed to parse killfeed line: {line} - {e}")
+            logger.debug("Failed to parse killfeed line: %s - %s", line, e)
             return None
     
     def _parse_timestamp(self, timestamp_str: str) -> Optional[datetime]:
@@ -405,7 +408,7 @@ class SimpleKillfeedProcessor:
             return None
             
         except Exception as e:
-            logger.debug(f"Failed to parse timestamp {timestamp_str}: {e}")
+            logger.debug("Failed to parse timestamp %s: %s", timestamp_str, e)
             return None
     
     def _extract_timestamp_from_filename(self, filename: str) -> Optional[str]:
@@ -483,17 +486,19 @@ class SimpleKillfeedProcessor:
                     
                     # Send with embed and file attachment
                     await channel.send(embed=embed, file=file)
-                    logger.info(f"✅ Delivered killfeed event: {event.killer} killed {event.victim} with {event.weapon}")
+                    logger.info("✅ Delivered killfeed event: %s killed %s with %s", event.killer, event.victim, event.weapon)
                     
                 except Exception as e:
-                    logger.error(f"Failed to deliver killfeed event: {e}")
+                    allowed, suppressed = _delivery_error_throttle.allow(self.guild_id)
+                    if allowed:
+                        logger.error(f"Failed to deliver killfeed event "
+                                     f"({suppressed} similar errors suppressed): {e}")
                     
         except Exception as e:
             logger.error(f"Killfeed delivery failed: {e}")
     
     async def _create_killfeed_embed(self, event: KillfeedEvent):
         """Create Discord embed for killfeed event using EmbedFactory for consistent branding"""
-        from bot.utils.embed_factory import EmbedFactory
         
         # Determine if this is a suicide event
         is_suicide = event.killer == event.victim
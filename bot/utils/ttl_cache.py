@@ -0,0 +1,91 @@
+"""
+Async TTL Cache
+Small LRU/TTL cache for read-mostly database lookups with single-flight loading
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+class AsyncTTLCache:
+    """
+    In-memory cache with per-entry TTL and LRU eviction
+
+    Concurrent misses for the same key share one loader call, so a cold key
+    never triggers more than one database query at a time.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a fresh cached value or default"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if time.monotonic() - entry[0] >= self.ttl:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entry when full"""
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        """Drop a single entry; an in-flight load for it will not be cached"""
+        self._data.pop(key, None)
+        self._inflight.pop(key, None)
+
+    def clear(self):
+        """Drop every entry"""
+        self._data.clear()
+        self._inflight.clear()
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]],
+                          cache_none: bool = False) -> Any:
+        """Return the cached value for key, calling loader once on a miss"""
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is not sentinel:
+            return value
+
+        future = self._inflight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except Exception as e:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            future.set_exception(e)
+            # Mark retrieved so waiter-less failures are not reported as unhandled
+            future.exception()
+            raise
+        except BaseException:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            future.cancel()
+            raise
+
+        # Only cache if nothing invalidated the key while the load was running
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+            if value is not None or cache_none:
+                self.set(key, value)
+        future.set_result(value)
+        return value
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -10,6 +10,7 @@ import os
 import sys
 import json
 import hashlib
+import importlib
 import re
 import time
 import traceback
@@ -33,6 +34,7 @@ from motor.motor_asyncio import AsyncIOMotorClient
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from bot.models.database import DatabaseManager
 from bot.utils.command_sync_recovery import initialize_command_sync_recovery
+from bot.utils.db_throttle import AsyncRateLimiter
 
 # Configure logging first
 logging.basicConfig(
@@ -100,6 +102,10 @@ class EmeraldKillfeedBot(discord.Bot):
 
         # Initialize variables
         self.db_manager = None
+        self.db_ready = asyncio.Event()  # Set while db_manager is connected and usable
+        self.premium_access_check = None  # Bound has_premium_access, resolved once the database is up
+        self.db_sem = asyncio.Semaphore(8)  # Caps in-flight command queries below the pool size
+        self.db_rate_limiter = AsyncRateLimiter(rps=50)
         self.premium_sync = None
         self.scheduler = AsyncIOScheduler()
         self.killfeed_parser = None
@@ -107,6 +113,10 @@ class EmeraldKillfeedBot(discord.Bot):
         self.historical_parser = None
         self.unified_log_parser = None
         self.ssh_connections = []
+
+        # Guild/member totals maintained by gateway events so /info avoids scanning caches
+        self._guild_count = 0
+        self._user_count = 0
         
         # Initialize command sync recovery system
         self.command_sync_recovery = None
@@ -120,55 +130,41 @@ class EmeraldKillfeedBot(discord.Bot):
 
     async def load_cogs(self):
         """Load all cogs with direct registration (py-cord 2.6.1 compatible)"""
-        from bot.cogs.core import Core
-        from bot.cogs.admin_channels import AdminChannels
-        from bot.cogs.admin_batch import AdminBatch
-        from bot.cogs.linking import Linking
-        from bot.cogs.stats import Stats
-        from bot.cogs.leaderboards_fixed import LeaderboardsFixed
-        from bot.cogs.automated_leaderboard import AutomatedLeaderboard
-        from bot.cogs.economy import Economy
-        from bot.cogs.professional_casino import ProfessionalCasino
-        from bot.cogs.bounties import Bounties
-        from bot.cogs.factions import Factions
-        from bot.cogs.subscription_management import SubscriptionManagement
-        from bot.cogs.premium import Premium
-        from bot.cogs.parsers import Parsers
-        from bot.cogs.cache_management import CacheManagement
-
-        cog_classes = [
-            ('Core', Core),
-            ('AdminChannels', AdminChannels),
-            ('AdminBatch', AdminBatch),
-            ('Linking', Linking),
-            ('Stats', Stats),
-            ('LeaderboardsFixed', LeaderboardsFixed),
-            ('AutomatedLeaderboard', AutomatedLeaderboard),
-            ('Economy', Economy),
-            ('ProfessionalCasino', ProfessionalCasino),
-            ('Bounties', Bounties),
-            ('Factions', Factions),
-            ('SubscriptionManagement', SubscriptionManagement),
-            ('Premium', Premium),
-            ('Parsers', Parsers),
-            ('CacheManagement', CacheManagement)
+        # (cog name, module path); modules are imported per cog so a broken file
+        # only drops that cog instead of aborting the whole batch
+        cog_specs = [
+            ('Core', 'bot.cogs.core'),
+            ('AdminChannels', 'bot.cogs.admin_channels'),
+            ('AdminBatch', 'bot.cogs.admin_batch'),
+            ('Linking', 'bot.cogs.linking'),
+            ('Stats', 'bot.cogs.stats'),
+            ('LeaderboardsFixed', 'bot.cogs.leaderboards_fixed'),
+            ('AutomatedLeaderboard', 'bot.cogs.automated_leaderboard'),
+            ('Economy', 'bot.cogs.economy'),
+            ('ProfessionalCasino', 'bot.cogs.professional_casino'),
+            ('Bounties', 'bot.cogs.bounties'),
+            ('Factions', 'bot.cogs.factions'),
+            ('SubscriptionManagement', 'bot.cogs.subscription_management'),
+            ('Premium', 'bot.cogs.premium'),
+            ('Parsers', 'bot.cogs.parsers'),
+            ('CacheManagement', 'bot.cogs.cache_management')
         ]
 
         loaded_count = 0
         failed_cogs = []
 
-        for name, cog_class in cog_classes:
+        for name, module_path in cog_specs:
             try:
+                cog_class = getattr(importlib.import_module(module_path), name)
                 cog_instance = cog_class(self)
                 self.add_cog(cog_instance)
                 logger.info(f"✅ Successfully loaded cog: {name}")
                 loaded_count += 1
             except Exception as e:
-                logger.error(f"❌ Failed to load cog {name}: {e}")
-                logger.error(f"Cog error traceback: {traceback.format_exc()}")
+                logger.error(f"❌ Failed to load cog {name}: {e}", exc_info=True)
                 failed_cogs.append(name)
 
-        logger.info(f"📊 Loaded {loaded_count}/{len(cog_classes)} cogs successfully")
+        logger.info(f"📊 Loaded {loaded_count}/{len(cog_specs)} cogs successfully")
 
         # Log command count (py-cord 2.6.1 compatible)
         total_commands = 0
@@ -541,6 +537,10 @@ class EmeraldKillfeedBot(discord.Bot):
             
             # Initialize database manager
             self.db_manager = DatabaseManager(self.mongo_client)
+            self.db_ready.set()
+
+            # Bind the premium check once instead of probing attributes per call
+            self.premium_access_check = self.db_manager.has_premium_access
             
             # Setup thread-safe wrapper with main loop
             self.db_wrapper = ThreadSafeDBWrapper(self.db_manager)
@@ -564,13 +564,17 @@ class EmeraldKillfeedBot(discord.Bot):
             
         except asyncio.TimeoutError:
             logger.error("❌ MongoDB connection timeout - Check your MONGO_URI and Atlas IP whitelist")
+            self.db_ready.clear()
             self.db_manager = None
+            self.premium_access_check = None
             self.db_wrapper = None
             return False
         except Exception as e:
             logger.error(f"❌ MongoDB init failed: {e} - Check your MONGO_URI secret and IP whitelist in Atlas")
             logger.error("❌ Database setup failed - operating in limited mode")
+            self.db_ready.clear()
             self.db_manager = None
+            self.premium_access_check = None
             self.db_wrapper = None
             return False
     def setup_scheduler(self):
@@ -605,6 +609,10 @@ class EmeraldKillfeedBot(discord.Bot):
 
     async def on_ready(self):
         """Called when bot is ready and connected to Discord"""
+        # Resync counters on every (re)connect; events keep them current afterwards
+        self._guild_count = len(self.guilds)
+        self._user_count = sum(g.member_count or 0 for g in self.guilds)
+
         # Only run setup once
         if hasattr(self, '_setup_complete'):
             logger.info("Bot already setup, skipping duplicate setup")
@@ -800,19 +808,29 @@ class EmeraldKillfeedBot(discord.Bot):
             self._setup_complete = True
 
         except Exception as e:
-            logger.error(f"❌ Critical error in bot setup: {e}")
-            import traceback
-            logger.error(f"Setup error traceback: {traceback.format_exc()}")
+            logger.error(f"❌ Critical error in bot setup: {e}", exc_info=True)
             raise
 
     async def on_guild_join(self, guild):
         """Called when bot joins a new guild - NO SYNC to prevent rate limits"""
         logger.info("Joined guild: %s (ID: %s)", guild.name, guild.id)
+        self._guild_count += 1
+        self._user_count += guild.member_count or 0
         logger.info("Commands will be available after next restart (bulletproof mode)")
 
+    async def on_member_join(self, member):
+        """Keep the cached member total current"""
+        self._user_count += 1
+
+    async def on_member_remove(self, member):
+        """Keep the cached member total current"""
+        self._user_count = max(0, self._user_count - 1)
+
     async def on_guild_remove(self, guild):
         """Called when bot is removed from a guild - Clean up all data"""
         logger.info("Left guild: %s (ID: %s)", guild.name, guild.id)
+        self._guild_count = max(0, self._guild_count - 1)
+        self._user_count = max(0, self._user_count - (guild.member_count or 0))
         
         try:
             # Comprehensive cleanup of all guild-related data
@@ -828,6 +846,7 @@ class EmeraldKillfeedBot(discord.Bot):
             
             result = await self.db_manager.db.server_premium_status.delete_many({"guild_id": guild_id})
             logger.info("Cleaned premium servers: %d documents", result.deleted_count)
+            self.db_manager.premium_access_cache.invalidate(guild_id)
             
             # Remove user data (stats, economy, linking)
             result = await self.db_manager.db.user_stats.delete_many({"guild_id": guild_id})
@@ -972,6 +991,11 @@ class EmeraldKillfeedBot(discord.Bot):
         """Clean shutdown"""
         logger.info("Shutting down bot...")
 
+        # Stop scheduled parser runs first so none starts while connections are being torn down
+        if self.scheduler.running:
+            self.scheduler.shutdown()
+            logger.info("Scheduler stopped")
+
         # Clean up SFTP connections
         await self.cleanup_connections()
 
@@ -980,11 +1004,8 @@ class EmeraldKillfeedBot(discord.Bot):
             await self.advanced_rate_limiter.flush_all_queues()
             logger.info("Advanced rate limiter flushed")
 
-        if self.scheduler.running:
-            self.scheduler.shutdown()
-            logger.info("Scheduler stopped")
-
         # Proper MongoDB cleanup
+        self.db_ready.clear()
         if hasattr(self, 'mongo_client') and self.mongo_client:
             try:
                 # Close all database operations gracefully
@@ -1034,6 +1055,7 @@ class EmeraldKillfeedBot(discord.Bot):
                 self.scheduler.shutdown()
                 logger.info("Scheduler stopped")
 
+            self.db_ready.clear()
             if hasattr(self, 'db_manager') and self.db_manager:
                     try:
                         if hasattr(self.db_manager, 'close'):
@@ -1095,5 +1117,4 @@ if __name__ == "__main__":
         asyncio.run(main())
     except Exception as e:
         print(f"Critical error in main execution: {e}")
-        import traceback
         traceback.print_exc()
\ No newline at end of file